@@ -0,0 +1,32 @@
+"""add keyset pagination indexes
+
+Revision ID: 5b8d0e2f4a71
+Revises: e19b7f3c5a02
+Create Date: 2026-10-17 12:08:39.661205
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5b8d0e2f4a71'
+down_revision: Union[str, None] = 'e19b7f3c5a02'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_journal_entries_user_id_entry_date_id', 'journal_entries', ['user_id', 'entry_date', 'id'], unique=False)
+    op.create_index('ix_tags_user_id_name_id', 'tags', ['user_id', 'name', 'id'], unique=False)
+    op.create_index('ix_categories_user_id_name_id', 'categories', ['user_id', 'name', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_categories_user_id_name_id', table_name='categories')
+    op.drop_index('ix_tags_user_id_name_id', table_name='tags')
+    op.drop_index('ix_journal_entries_user_id_entry_date_id', table_name='journal_entries')
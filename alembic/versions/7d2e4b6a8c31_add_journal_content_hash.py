@@ -0,0 +1,28 @@
+"""add journal content hash
+
+Revision ID: 7d2e4b6a8c31
+Revises: 3a1c5e7d9b20
+Create Date: 2026-10-17 10:03:17.552961
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7d2e4b6a8c31'
+down_revision: Union[str, None] = '3a1c5e7d9b20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('journal_entries', sa.Column('content_hash', sa.String(length=64), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('journal_entries', 'content_hash')
@@ -0,0 +1,40 @@
+"""add journal search vector
+
+Revision ID: 9f3a6c1d8e47
+Revises: 5b8d0e2f4a71
+Create Date: 2026-10-17 12:47:15.208834
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '9f3a6c1d8e47'
+down_revision: Union[str, None] = '5b8d0e2f4a71'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('journal_entries', sa.Column(
+        'search_vector',
+        postgresql.TSVECTOR(),
+        sa.Computed(
+            "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+            "setweight(to_tsvector('english', coalesce(summary, '')), 'B') || "
+            "setweight(to_tsvector('english', content), 'C')",
+            persisted=True,
+        ),
+        nullable=True
+    ))
+    op.create_index('ix_journal_entries_search_vector', 'journal_entries', ['search_vector'], unique=False, postgresql_using='gin')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_journal_entries_search_vector', table_name='journal_entries', postgresql_using='gin')
+    op.drop_column('journal_entries', 'search_vector')
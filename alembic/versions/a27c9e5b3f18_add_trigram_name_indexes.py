@@ -0,0 +1,31 @@
+"""add trigram name indexes
+
+Revision ID: a27c9e5b3f18
+Revises: 9f3a6c1d8e47
+Create Date: 2026-10-17 13:21:50.734412
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a27c9e5b3f18'
+down_revision: Union[str, None] = '9f3a6c1d8e47'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index('ix_tags_name_trgm', 'tags', ['name'], unique=False, postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'})
+    op.create_index('ix_categories_name_trgm', 'categories', ['name'], unique=False, postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'})
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_categories_name_trgm', table_name='categories', postgresql_using='gin')
+    op.drop_index('ix_tags_name_trgm', table_name='tags', postgresql_using='gin')
@@ -0,0 +1,28 @@
+"""add sentiment scores extremes index
+
+Revision ID: b8e4d2a6c913
+Revises: f5a9c2e7b1d3
+Create Date: 2026-10-17 16:05:41.118204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b8e4d2a6c913'
+down_revision: Union[str, None] = 'f5a9c2e7b1d3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_sentiment_scores_journal_id_created_at', 'sentiment_scores', ['journal_id', 'created_at'], unique=False, postgresql_include=['score', 'mood'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_sentiment_scores_journal_id_created_at', table_name='sentiment_scores')
@@ -0,0 +1,63 @@
+"""merge case-variant tags and categories
+
+Revision ID: c2d7e9f1a4b6
+Revises: b8e4d2a6c913
+Create Date: 2026-10-17 19:52:37.402915
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c2d7e9f1a4b6'
+down_revision: Union[str, None] = 'b8e4d2a6c913'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (table, link table, link column)
+NAMED_TABLES = [
+    ('tags', 'journal_entry_tags', 'tag_id'),
+    ('categories', 'journal_entry_categories', 'category_id'),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Entry create/update used to store lowercased names while the tag/category
+    # endpoints stored uppercased ones; names are now normalized with
+    # strip + upper, so fold the variants of each name into one row.
+    for table, links, column in NAMED_TABLES:
+        op.execute(f"""
+            CREATE TEMPORARY TABLE name_merge ON COMMIT DROP AS
+            SELECT id, keep_id FROM (
+                SELECT
+                    id,
+                    first_value(id) OVER (
+                        PARTITION BY user_id, upper(btrim(name))
+                        ORDER BY (name = upper(btrim(name))) DESC, id
+                    ) AS keep_id
+                FROM {table}
+            ) AS ranked
+            WHERE id <> keep_id
+        """)
+        op.execute(f"""
+            INSERT INTO {links} (journal_entry_id, {column})
+            SELECT links.journal_entry_id, name_merge.keep_id
+            FROM {links} AS links
+            JOIN name_merge ON name_merge.id = links.{column}
+            ON CONFLICT DO NOTHING
+        """)
+        op.execute(f"DELETE FROM {links} USING name_merge WHERE {links}.{column} = name_merge.id")
+        op.execute(f"DELETE FROM {table} USING name_merge WHERE {table}.id = name_merge.id")
+        op.execute(f"UPDATE {table} SET name = upper(btrim(name)) WHERE name <> upper(btrim(name))")
+        op.execute("DROP TABLE name_merge")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Merged rows cannot be split back apart
+    pass
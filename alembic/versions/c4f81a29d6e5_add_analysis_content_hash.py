@@ -0,0 +1,38 @@
+"""add analysis content hash
+
+Revision ID: c4f81a29d6e5
+Revises: 7d2e4b6a8c31
+Create Date: 2026-10-17 10:41:52.904417
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4f81a29d6e5'
+down_revision: Union[str, None] = '7d2e4b6a8c31'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('analytics_data', sa.Column('content_hash', sa.String(length=64), nullable=True))
+    op.add_column('analytics_data', sa.Column('analysis_version', sa.String(), nullable=True))
+    op.add_column('analytics_data', sa.Column('analysis', postgresql.JSON(astext_type=sa.Text()), nullable=True))
+    op.create_index('ix_analytics_data_content_hash', 'analytics_data', ['content_hash', 'analysis_version'], unique=False)
+    op.add_column('sentiment_scores', sa.Column('content_hash', sa.String(length=64), nullable=True))
+    op.add_column('sentiment_scores', sa.Column('analysis_version', sa.String(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('sentiment_scores', 'analysis_version')
+    op.drop_column('sentiment_scores', 'content_hash')
+    op.drop_index('ix_analytics_data_content_hash', table_name='analytics_data')
+    op.drop_column('analytics_data', 'analysis')
+    op.drop_column('analytics_data', 'analysis_version')
+    op.drop_column('analytics_data', 'content_hash')
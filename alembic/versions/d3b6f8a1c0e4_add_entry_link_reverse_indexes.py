@@ -0,0 +1,30 @@
+"""add entry link reverse indexes
+
+Revision ID: d3b6f8a1c0e4
+Revises: a27c9e5b3f18
+Create Date: 2026-10-17 13:47:12.209833
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd3b6f8a1c0e4'
+down_revision: Union[str, None] = 'a27c9e5b3f18'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_journal_entry_tags_tag_id_journal_entry_id', 'journal_entry_tags', ['tag_id', 'journal_entry_id'], unique=False)
+    op.create_index('ix_journal_entry_categories_category_id_journal_entry_id', 'journal_entry_categories', ['category_id', 'journal_entry_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_journal_entry_categories_category_id_journal_entry_id', table_name='journal_entry_categories')
+    op.drop_index('ix_journal_entry_tags_tag_id_journal_entry_id', table_name='journal_entry_tags')
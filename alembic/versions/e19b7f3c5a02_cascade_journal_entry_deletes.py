@@ -0,0 +1,38 @@
+"""cascade journal entry deletes
+
+Revision ID: e19b7f3c5a02
+Revises: c4f81a29d6e5
+Create Date: 2026-10-17 11:26:08.147730
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e19b7f3c5a02'
+down_revision: Union[str, None] = 'c4f81a29d6e5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+FOREIGN_KEYS = [
+    ('journal_entry_tags_journal_entry_id_fkey', 'journal_entry_tags', 'journal_entry_id'),
+    ('journal_entry_categories_journal_entry_id_fkey', 'journal_entry_categories', 'journal_entry_id'),
+    ('sentiment_scores_journal_id_fkey', 'sentiment_scores', 'journal_id'),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for name, table, column in FOREIGN_KEYS:
+        op.drop_constraint(name, table, type_='foreignkey')
+        op.create_foreign_key(name, table, 'journal_entries', [column], ['id'], ondelete='CASCADE')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for name, table, column in FOREIGN_KEYS:
+        op.drop_constraint(name, table, type_='foreignkey')
+        op.create_foreign_key(name, table, 'journal_entries', [column], ['id'])
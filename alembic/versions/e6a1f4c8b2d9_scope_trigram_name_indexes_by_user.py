@@ -0,0 +1,35 @@
+"""scope trigram name indexes by user
+
+Revision ID: e6a1f4c8b2d9
+Revises: c2d7e9f1a4b6
+Create Date: 2026-10-17 20:04:11.518263
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e6a1f4c8b2d9'
+down_revision: Union[str, None] = 'c2d7e9f1a4b6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS btree_gin")
+    op.drop_index('ix_categories_name_trgm', table_name='categories', postgresql_using='gin')
+    op.drop_index('ix_tags_name_trgm', table_name='tags', postgresql_using='gin')
+    op.create_index('ix_tags_user_id_name_trgm', 'tags', ['user_id', 'name'], unique=False, postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'})
+    op.create_index('ix_categories_user_id_name_trgm', 'categories', ['user_id', 'name'], unique=False, postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'})
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_categories_user_id_name_trgm', table_name='categories', postgresql_using='gin')
+    op.drop_index('ix_tags_user_id_name_trgm', table_name='tags', postgresql_using='gin')
+    op.create_index('ix_tags_name_trgm', 'tags', ['name'], unique=False, postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'})
+    op.create_index('ix_categories_name_trgm', 'categories', ['name'], unique=False, postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'})
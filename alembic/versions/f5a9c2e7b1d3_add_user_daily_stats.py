@@ -0,0 +1,115 @@
+"""add user daily stats
+
+Revision ID: f5a9c2e7b1d3
+Revises: d3b6f8a1c0e4
+Create Date: 2026-10-17 14:32:05.118274
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = 'f5a9c2e7b1d3'
+down_revision: Union[str, None] = 'd3b6f8a1c0e4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    mood = postgresql.ENUM('POSITIVE', 'NEGATIVE', 'NEUTRAL', name='mood', create_type=False)
+    op.create_table('user_daily_stats',
+    sa.Column('user_id', sa.UUID(), nullable=False),
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('entries', sa.Integer(), nullable=False),
+    sa.Column('words', sa.Integer(), nullable=False),
+    sa.Column('characters', sa.Integer(), nullable=False),
+    sa.Column('morning_entries', sa.Integer(), nullable=False),
+    sa.Column('afternoon_entries', sa.Integer(), nullable=False),
+    sa.Column('evening_entries', sa.Integer(), nullable=False),
+    sa.Column('sentiment_count', sa.Integer(), nullable=False),
+    sa.Column('sentiment_sum', sa.Float(), nullable=False),
+    sa.Column('sentiment_min', sa.Float(), nullable=True),
+    sa.Column('sentiment_max', sa.Float(), nullable=True),
+    sa.Column('sentiment_min_mood', mood, nullable=True),
+    sa.Column('sentiment_max_mood', mood, nullable=True),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('user_id', 'day')
+    )
+
+    # Backfill from the source tables, the same statement as daily_stats.rebuild()
+    op.execute("""
+        INSERT INTO user_daily_stats (
+            user_id, day, entries, words, characters,
+            morning_entries, afternoon_entries, evening_entries,
+            sentiment_count, sentiment_sum, sentiment_min, sentiment_max,
+            sentiment_min_mood, sentiment_max_mood, updated_at
+        )
+        SELECT
+            coalesce(a.user_id, s.user_id),
+            coalesce(a.day, s.day),
+            coalesce(a.entries, 0),
+            coalesce(a.words, 0),
+            coalesce(a.characters, 0),
+            coalesce(a.morning_entries, 0),
+            coalesce(a.afternoon_entries, 0),
+            coalesce(a.evening_entries, 0),
+            coalesce(s.sentiment_count, 0),
+            coalesce(s.sentiment_sum, 0),
+            s.sentiment_min,
+            s.sentiment_max,
+            s.sentiment_min_mood,
+            s.sentiment_max_mood,
+            now()
+        FROM (
+            SELECT
+                journal_entries.user_id AS user_id,
+                date(timezone('UTC', analytics_data.entry_date)) AS day,
+                count(*) AS entries,
+                sum(analytics_data.word_count) AS words,
+                sum(analytics_data.character_count) AS characters,
+                count(*) FILTER (WHERE analytics_data.time_of_day = 'MORNING') AS morning_entries,
+                count(*) FILTER (WHERE analytics_data.time_of_day = 'AFTERNOON') AS afternoon_entries,
+                count(*) FILTER (WHERE analytics_data.time_of_day = 'EVENING') AS evening_entries
+            FROM analytics_data
+            JOIN journal_entries ON journal_entries.id = analytics_data.journal_id
+            GROUP BY journal_entries.user_id, date(timezone('UTC', analytics_data.entry_date))
+        ) AS a
+        FULL OUTER JOIN (
+            SELECT
+                journal_entries.user_id AS user_id,
+                date(timezone('UTC', sentiment_scores.created_at)) AS day,
+                count(*) AS sentiment_count,
+                sum(sentiment_scores.score) AS sentiment_sum,
+                min(sentiment_scores.score) AS sentiment_min,
+                max(sentiment_scores.score) AS sentiment_max,
+                (array_agg(sentiment_scores.mood ORDER BY sentiment_scores.score ASC))[1] AS sentiment_min_mood,
+                (array_agg(sentiment_scores.mood ORDER BY sentiment_scores.score DESC))[1] AS sentiment_max_mood
+            FROM sentiment_scores
+            JOIN journal_entries ON journal_entries.id = sentiment_scores.journal_id
+            GROUP BY journal_entries.user_id, date(timezone('UTC', sentiment_scores.created_at))
+        ) AS s ON a.user_id = s.user_id AND a.day = s.day
+        ON CONFLICT (user_id, day) DO UPDATE SET
+            entries = excluded.entries,
+            words = excluded.words,
+            characters = excluded.characters,
+            morning_entries = excluded.morning_entries,
+            afternoon_entries = excluded.afternoon_entries,
+            evening_entries = excluded.evening_entries,
+            sentiment_count = excluded.sentiment_count,
+            sentiment_sum = excluded.sentiment_sum,
+            sentiment_min = excluded.sentiment_min,
+            sentiment_max = excluded.sentiment_max,
+            sentiment_min_mood = excluded.sentiment_min_mood,
+            sentiment_max_mood = excluded.sentiment_max_mood,
+            updated_at = excluded.updated_at
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('user_daily_stats')
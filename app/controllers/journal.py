@@ -1,42 +1,89 @@
-from sqlalchemy.orm import selectinload
-from sqlalchemy import  delete
+from sqlalchemy.orm import selectinload, aliased, undefer
+from sqlalchemy import  delete, update, exists, literal, literal_column, case, tuple_, func, or_
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
-from typing import List
+from typing import AsyncIterator, List, Optional
 
 from fastapi import Query, HTTPException, status
+from pydantic import ValidationError
 
-from app.db.models import Category, Tag, JournalEntryTag, JournalEntry, JournalEntryCategory
+from app.db.models import Category, Tag, JournalEntryTag, JournalEntry, JournalEntryCategory, AnalyticsData, SentimentScore
 
-from app.schemas.journal import CategorySchema, TagSchema, CreateJournalEntrySchema
+from app.schemas.journal import (
+    CategorySchema, TagSchema, CreateJournalEntrySchema, ImportJournalEntrySchema,
+    BatchEntriesSchema, BatchGetEntriesSchema, BatchRetagEntriesSchema, DraftSchema, EntryFilterSchema
+)
 
-from app.services.queueing import publish_to_queue
+from app.core.logger import logger
+from app.core.redis_helper import RedisHelper
+
+from app.services.queueing import publish_to_queue, publish_many_to_queue
+from app.services.outbox_relay import notify_outbox
+from app.services import tag_resolver, drafts, response_cache, daily_stats, summary_cache
+from app.utils.functions import content_hash, encode_cursor, decode_cursor, make_etag
+
+import csv
+import hashlib
+import html
+import io
+import json
+import tempfile
 
 from datetime import datetime
 
-from uuid import UUID
+from uuid import UUID, uuid4
+
+
+def _parse_cursor(cursor: str, *types) -> list:
+    try:
+        values = decode_cursor(cursor)
+        if len(values) != len(types):
+            raise ValueError("Invalid cursor")
+        return [type_(value) for type_, value in zip(types, values)]
+    except (ValueError, TypeError, AttributeError):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+
+
+async def _touch_entries(db: AsyncSession, entry_ids):
+    """Bump updated_at on entries whose rendered tags/categories changed, so their ETags move."""
+    await db.execute(
+        update(JournalEntry)
+        .where(JournalEntry.id.in_(entry_ids))
+        .values(updated_at=datetime.now())
+        .execution_options(synchronize_session=False)
+    )
 
 
 async def get_categories(
         db: AsyncSession,
         user_id: UUID,
         page: int = 1,
-        limit: int = 10
+        limit: int = 10,
+        cursor: Optional[str] = None
 ) -> tuple:
-    skip = (page - 1) * limit
-    result = await db.execute(
+    stmt = (
         select(Category).filter(Category.user_id == user_id)
-        .order_by(Category.name.asc())
-        .offset(skip)
+        .order_by(Category.name.asc(), Category.id.asc())
         .limit(limit)
     )
+    if cursor is None:
+        stmt = stmt.offset((page - 1) * limit)
+    elif cursor:
+        name, id_ = _parse_cursor(cursor, str, UUID)
+        stmt = stmt.filter(tuple_(Category.name, Category.id) > (name, id_))
+
+    result = await db.execute(stmt)
     categories = result.scalars().all()
 
-    if not categories:
+    if not categories and cursor is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Categories not found")
 
-    return {"categories": categories}, status.HTTP_200_OK
+    next_cursor = encode_cursor([categories[-1].name, categories[-1].id]) if len(categories) == limit else None
+
+    return {"categories": categories, "nextCursor": next_cursor}, status.HTTP_200_OK
 
 
 async def create_journal_category(
@@ -46,31 +93,39 @@ async def create_journal_category(
 ):
     category_name = category_data.category_name
 
+    # Duplicate check and insert in one statement
     result = await db.execute(
-        select(Category).filter(
-            Category.name.ilike(category_name),
-            Category.user_id == user_id
+        insert(Category)
+        .from_select(
+            ["id", "name", "user_id"],
+            select(
+                literal(uuid4(), Category.id.type),
+                literal(category_name),
+                literal(user_id, Category.user_id.type)
+            ).where(
+                ~exists().where(
+                    Category.name.ilike(category_name),
+                    Category.user_id == user_id
+                )
+            )
         )
+        .on_conflict_do_nothing()
+        .returning(Category.id, Category.name, Category.user_id)
     )
-    existing_category = result.scalar_one_or_none()
+    category = result.first()
 
-    if existing_category:
+    if not category:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail="Category exists!"
         )
 
-    category = Category(
-        name=category_name,
-        user_id=user_id
-    )
-    db.add(category)
     await db.commit()
-    await db.refresh(category)
+    await response_cache.invalidate_user(user_id)
 
     return {
         "message": "Category created!",
-        "category": category
+        "category": dict(category._mapping)
     }, status.HTTP_200_OK
 
 
@@ -82,13 +137,24 @@ async def update_journal_category(
 ):
     category_name = category_data.category_name
 
-    result = await db.execute(
-        select(Category).filter(
-            Category.id == category_id,
-            Category.user_id == user_id
+    try:
+        result = await db.execute(
+            update(Category)
+            .where(
+                Category.id == category_id,
+                Category.user_id == user_id
+            )
+            .values(name=category_name)
+            .returning(Category.id, Category.name, Category.user_id)
+            .execution_options(synchronize_session=False)
+        )
+        category = result.first()
+    except IntegrityError:
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Category exists!"
         )
-    )
-    category = result.scalar_one_or_none()
 
     if not category:
         raise HTTPException(
@@ -96,13 +162,18 @@ async def update_journal_category(
             detail="Category not found or does not belong to the user."
         )
 
-    category.name = category_name
+    await _touch_entries(
+        db,
+        select(JournalEntryCategory.journal_entry_id).where(JournalEntryCategory.category_id == category.id)
+    )
     await db.commit()
-    await db.refresh(category)
+    await response_cache.invalidate_user(user_id)
+    await summary_cache.invalidate_user(user_id)
+    tag_resolver.invalidate(category.id)
 
     return {
         "message": "Category updated!",
-        "category": category
+        "category": dict(category._mapping)
     }, status.HTTP_200_OK
 
 
@@ -111,36 +182,42 @@ async def delete_journal_category(
         category_id: str,
         user_id: str
 ):
+    # Ownership and usage checks ride along with the delete
     result = await db.execute(
-        select(Category).filter(
+        delete(Category)
+        .where(
             Category.id == category_id,
-            Category.user_id == user_id
+            Category.user_id == user_id,
+            ~exists().where(JournalEntryCategory.category_id == Category.id)
         )
+        .returning(Category.id)
+        .execution_options(synchronize_session=False)
     )
-    category = result.scalar_one_or_none()
-
-    if not category:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Category not found or does not belong to the user."
-        )
+    deleted_id = result.scalar_one_or_none()
 
-    result = await db.execute(
-        select(JournalEntryCategory).filter(
-            JournalEntryCategory.category_id == category_id
+    if not deleted_id:
+        result = await db.execute(
+            select(
+                exists().where(
+                    Category.id == category_id,
+                    Category.user_id == user_id
+                )
+            )
         )
-    )
-    category_usage = result.scalar_one_or_none()
+        if not result.scalar():
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Category not found or does not belong to the user."
+            )
 
-    if category_usage:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Category cannot be deleted as it is used in a journal entry."
         )
 
-    # Delete the category
-    await db.delete(category)
     await db.commit()
+    await response_cache.invalidate_user(user_id)
+    tag_resolver.invalidate(deleted_id)
 
     return {
         "message": "Category deleted successfully!"
@@ -151,21 +228,76 @@ async def get_tags(
         db: AsyncSession,
         user_id: UUID,
         page: int = 1,
-        limit: int = 10
+        limit: int = 10,
+        cursor: Optional[str] = None
 ) -> tuple:
-    skip = (page - 1) * limit
-    result = await db.execute(
+    stmt = (
         select(Tag).filter(Tag.user_id == user_id)
-        .order_by(Tag.name.asc())
-        .offset(skip)
+        .order_by(Tag.name.asc(), Tag.id.asc())
         .limit(limit)
     )
+    if cursor is None:
+        stmt = stmt.offset((page - 1) * limit)
+    elif cursor:
+        name, id_ = _parse_cursor(cursor, str, UUID)
+        stmt = stmt.filter(tuple_(Tag.name, Tag.id) > (name, id_))
+
+    result = await db.execute(stmt)
     tags = result.scalars().all()
 
-    if not tags:
+    if not tags and cursor is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Tags not found")
 
-    return {"tags": tags}, status.HTTP_200_OK
+    next_cursor = encode_cursor([tags[-1].name, tags[-1].id]) if len(tags) == limit else None
+
+    return {"tags": tags, "nextCursor": next_cursor}, status.HTTP_200_OK
+
+
+AUTOCOMPLETE_TRIGRAM_MIN_LENGTH = 3
+
+
+async def autocomplete_names(
+        db: AsyncSession,
+        model,
+        user_id: str,
+        query: str,
+        limit: int = 10
+) -> list:
+    """Top-k prefix matches first, then fuzzy (trigram) matches."""
+    prefix = query.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+    is_prefix = model.name.ilike(prefix, escape="\\")
+
+    stmt = select(model.id, model.name).filter(model.user_id == user_id).limit(limit)
+    if len(query) < AUTOCOMPLETE_TRIGRAM_MIN_LENGTH:
+        # Too short to yield a trigram; scan the user's names through the (user_id, name) btree
+        stmt = stmt.filter(is_prefix).order_by(model.name.asc())
+    else:
+        stmt = (
+            stmt.filter(or_(is_prefix, model.name.op("%")(query)))
+            .order_by(is_prefix.desc(), func.similarity(model.name, query).desc(), model.name.asc())
+        )
+
+    result = await db.execute(stmt)
+
+    return [{"id": str(id_), "name": name} for id_, name in result.all()]
+
+
+async def autocomplete_tags(
+        db: AsyncSession,
+        user_id: str,
+        query: str,
+        limit: int = 10
+):
+    return {"tags": await autocomplete_names(db, Tag, user_id, query, limit)}, status.HTTP_200_OK
+
+
+async def autocomplete_categories(
+        db: AsyncSession,
+        user_id: str,
+        query: str,
+        limit: int = 10
+):
+    return {"categories": await autocomplete_names(db, Category, user_id, query, limit)}, status.HTTP_200_OK
 
 
 async def create_journal_tag(
@@ -175,31 +307,39 @@ async def create_journal_tag(
 ):
     tag_name = tag_data.tag_name
 
+    # Duplicate check and insert in one statement
     result = await db.execute(
-        select(Tag).filter(
-            Tag.name.ilike(tag_name),
-            Tag.user_id == user_id
+        insert(Tag)
+        .from_select(
+            ["id", "name", "user_id"],
+            select(
+                literal(uuid4(), Tag.id.type),
+                literal(tag_name),
+                literal(user_id, Tag.user_id.type)
+            ).where(
+                ~exists().where(
+                    Tag.name.ilike(tag_name),
+                    Tag.user_id == user_id
+                )
+            )
         )
+        .on_conflict_do_nothing()
+        .returning(Tag.id, Tag.name, Tag.user_id)
     )
-    existing_tag = result.scalar_one_or_none()
+    tag = result.first()
 
-    if existing_tag:
+    if not tag:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail="Tag exists!"
         )
 
-    tag = Tag(
-        name=tag_name,
-        user_id=user_id
-    )
-    db.add(tag)
     await db.commit()
-    await db.refresh(tag)
+    await response_cache.invalidate_user(user_id)
 
     return {
         "message": "Tag created!",
-        "tag": tag
+        "tag": dict(tag._mapping)
     }, status.HTTP_200_OK
 
 
@@ -211,13 +351,24 @@ async def update_journal_tag(
 ):
     tag_name = tag_data.tag_name
 
-    result = await db.execute(
-        select(Tag).filter(
-            Tag.id == tag_id,
-            Tag.user_id == user_id
+    try:
+        result = await db.execute(
+            update(Tag)
+            .where(
+                Tag.id == tag_id,
+                Tag.user_id == user_id
+            )
+            .values(name=tag_name)
+            .returning(Tag.id, Tag.name, Tag.user_id)
+            .execution_options(synchronize_session=False)
+        )
+        tag = result.first()
+    except IntegrityError:
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Tag exists!"
         )
-    )
-    tag = result.scalar_one_or_none()
 
     if not tag:
         raise HTTPException(
@@ -225,13 +376,17 @@ async def update_journal_tag(
             detail="Tag not found or does not belong to the user."
         )
 
-    tag.name = tag_name
+    await _touch_entries(
+        db,
+        select(JournalEntryTag.journal_entry_id).where(JournalEntryTag.tag_id == tag.id)
+    )
     await db.commit()
-    await db.refresh(tag)
+    await response_cache.invalidate_user(user_id)
+    tag_resolver.invalidate(tag.id)
 
     return {
         "message": "Tag updated!",
-        "tag": tag
+        "tag": dict(tag._mapping)
     }, status.HTTP_200_OK
 
 
@@ -240,46 +395,105 @@ async def delete_journal_tag(
         tag_id: str,
         user_id: str
 ):
+    # Ownership and usage checks ride along with the delete
     result = await db.execute(
-        select(Tag).filter(
+        delete(Tag)
+        .where(
             Tag.id == tag_id,
-            Tag.user_id == user_id
+            Tag.user_id == user_id,
+            ~exists().where(JournalEntryTag.tag_id == Tag.id)
         )
+        .returning(Tag.id)
+        .execution_options(synchronize_session=False)
     )
-    tag = result.scalar_one_or_none()
-
-    if not tag:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Tag not found or does not belong to the user."
-        )
+    deleted_id = result.scalar_one_or_none()
 
-    # Check if the tag is being used in any journal entries
-    result = await db.execute(
-        select(JournalEntryTag).filter(
-            JournalEntryTag.tag_id == tag_id
+    if not deleted_id:
+        result = await db.execute(
+            select(
+                exists().where(
+                    Tag.id == tag_id,
+                    Tag.user_id == user_id
+                )
+            )
         )
-    )
-    tag_usage = result.scalar_one_or_none()
+        if not result.scalar():
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Tag not found or does not belong to the user."
+            )
 
-    if tag_usage:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Tag cannot be deleted as it is used in a journal entry."
         )
 
-    await db.delete(tag)
     await db.commit()
+    await response_cache.invalidate_user(user_id)
+    tag_resolver.invalidate(deleted_id)
 
     return {
         "message": "Tag deleted successfully!"
     }, status.HTTP_200_OK
 
 
+IDEMPOTENCY_KEY_PREFIX = "idempotency"
+IDEMPOTENCY_TTL_SECONDS = 24 * 60 * 60
+IDEMPOTENCY_PENDING_TTL_SECONDS = 60
+
+
 async def create_journal_entry(
     db: AsyncSession,
     parsed_data: CreateJournalEntrySchema,
     user_id: str,
+    idempotency_key: Optional[str] = None,
+):
+    if not idempotency_key:
+        return await _create_journal_entry(db, parsed_data, user_id)
+
+    unique_key = f"{user_id}:{idempotency_key}"
+    redis_key = RedisHelper._make_key(IDEMPOTENCY_KEY_PREFIX, unique_key)
+    request_hash = hashlib.sha256(parsed_data.model_dump_json(exclude_unset=True).encode("utf-8")).hexdigest()
+
+    # Replays are answered from Redis without touching Postgres or the queue
+    stored = await RedisHelper.redis_get(redis_key)
+    if stored and stored.get("requestHash", request_hash) != request_hash:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="This Idempotency-Key was already used with a different request body."
+        )
+    if stored and "response" in stored:
+        return stored["response"], stored["status"]
+
+    claimed = await RedisHelper.redis_set_nx(
+        redis_key, {"idempotencyKey": unique_key, "requestHash": request_hash}, expiry=IDEMPOTENCY_PENDING_TTL_SECONDS
+    )
+    if stored or claimed is False:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="A request with this Idempotency-Key is already in progress."
+        )
+
+    try:
+        result, code = await _create_journal_entry(db, parsed_data, user_id)
+    except Exception:
+        await RedisHelper.redis_delete(redis_key)
+        raise
+
+    await RedisHelper.redis_set(
+        IDEMPOTENCY_KEY_PREFIX,
+        {"idempotencyKey": unique_key, "requestHash": request_hash, "response": result, "status": code},
+        expiry=IDEMPOTENCY_TTL_SECONDS,
+        data_actions={"uniqueKey": "idempotencyKey"},
+    )
+
+    return result, code
+
+
+async def _create_journal_entry(
+    db: AsyncSession,
+    parsed_data: CreateJournalEntrySchema,
+    user_id: str,
 ):
     title = parsed_data.title or ""
     content = parsed_data.content
@@ -290,6 +504,7 @@ async def create_journal_entry(
     journal_entry = JournalEntry(
         title=title,
         content=content,
+        content_hash=content_hash(content),
         user_id=user_id,
         entry_date=datetime.now(),
     )
@@ -297,54 +512,12 @@ async def create_journal_entry(
     db.add(journal_entry)
     await db.flush()
 
-    # Handle tags
-    for tag_name in tags:
-        tag_name = tag_name.lower()
-
-        result = await db.execute(
-            select(Tag).filter_by(name=tag_name, user_id=user_id)
-        )
-        tag = result.scalars().first()
-
-        if not tag:
-            tag = Tag(name=tag_name, user_id=user_id)
-            db.add(tag)
-            await db.flush()
+    # Resolve tags and categories set-wise, then link them in one insert each
+    tag_ids = await tag_resolver.resolve_tags(db, tags, user_id)
+    category_ids = await tag_resolver.resolve_categories(db, categories, user_id)
 
-        tag_assoc = JournalEntryTag(journal_id=journal_entry.id, tag_id=tag.id)
-        db.add(tag_assoc)
-
-    # Handle categories
-    for category_name in categories:
-        category_name = category_name.lower()
-
-        result = await db.execute(
-            select(Category).filter_by(name=category_name, user_id=user_id)
-        )
-        category = result.scalars().first()
-
-        if not category:
-            category = Category(name=category_name, user_id=user_id)
-            db.add(category)
-            await db.flush()
-
-        category_assoc = JournalEntryCategory(
-            journal_id=journal_entry.id, category_id=category.id
-        )
-        db.add(category_assoc)
-
-    await db.commit()
-
-    # Eager-load the relationships to avoid lazy loading in async context
-    result = await db.execute(
-        select(JournalEntry)
-        .options(
-            selectinload(JournalEntry.tags),
-            selectinload(JournalEntry.categories),
-        )
-        .filter(JournalEntry.id == journal_entry.id)
-    )
-    journal_entry = result.scalars().first()
+    tag_ids = await tag_resolver.link_entry(db, Tag, JournalEntryTag, "tag_id", journal_entry.id, tag_ids, user_id)
+    category_ids = await tag_resolver.link_entry(db, Category, JournalEntryCategory, "category_id", journal_entry.id, category_ids, user_id)
 
     journal_dict = {
         "id": str(journal_entry.id),
@@ -352,11 +525,17 @@ async def create_journal_entry(
         "content": journal_entry.content,
         "entryDate": journal_entry.entry_date.isoformat(),
         "userId": str(journal_entry.user_id),
-        "tags": [tag.name for tag in journal_entry.tags],
-        "categories": [cat.name for cat in journal_entry.categories],
+        "tags": list(tag_ids),
+        "categories": list(category_ids),
     }
 
-    publish_to_queue("", "entry_queue", journal_dict)
+    # Staged in the same transaction as the entry, so it is never lost or orphaned
+    publish_to_queue(db, "", "entry_queue", journal_dict)
+
+    await db.commit()
+    await response_cache.invalidate_user(user_id)
+    await summary_cache.invalidate_months(user_id, [daily_stats.to_utc_day(journal_entry.entry_date)])
+    notify_outbox()
 
     return {"message": "Entry created!", "journal": journal_dict}, status.HTTP_201_CREATED
 
@@ -368,76 +547,411 @@ async def update_journal_entry(
     journal_id: str
 ):
 
+    new_hash = content_hash(update_data.content)
+
+    # An explicit save supersedes any pending autosave; drop it before taking the
+    # row lock so the draft flusher cannot write it over this save
+    await drafts.discard_drafts(user_id, [journal_id])
+
+    # Self-join so RETURNING can compare against the pre-update row
+    previous = aliased(JournalEntry)
     result = await db.execute(
-        select(JournalEntry).filter_by(id=journal_id, user_id=user_id)
+        update(JournalEntry)
+        .where(
+            JournalEntry.id == journal_id,
+            JournalEntry.user_id == user_id,
+            previous.id == JournalEntry.id
+        )
+        .values(
+            title=update_data.title,
+            content=update_data.content,
+            content_hash=new_hash,
+            updated_at=datetime.now()
+        )
+        .returning(
+            JournalEntry.entry_date,
+            case(
+                (previous.content_hash.isnot(None), previous.content_hash != new_hash),
+                else_=previous.content != update_data.content
+            ).label("content_changed")
+        )
+        .execution_options(synchronize_session=False)
     )
-    journal = result.scalars().first()
+    journal = result.first()
 
     if not journal:
         raise HTTPException(status_code=404, detail="Journal entry not found")
 
-    journal.title = update_data.title
-    journal.content = update_data.content
+    content_changed = journal.content_changed
+
+    # Apply only the association delta
+    tag_ids = await tag_resolver.resolve_tags(db, update_data.tags or [], user_id)
+    category_ids = await tag_resolver.resolve_categories(db, update_data.categories or [], user_id)
+
+    tag_ids = await tag_resolver.sync_entry_links(db, Tag, JournalEntryTag, "tag_id", journal_id, tag_ids, user_id)
+    category_ids = await tag_resolver.sync_entry_links(db, Category, JournalEntryCategory, "category_id", journal_id, category_ids, user_id)
+
+    # Tag/title-only edits don't need fresh sentiment or analysis
+    if content_changed:
+        journal_dict = {
+            "id": str(journal_id),
+            "title": update_data.title,
+            "content": update_data.content,
+            "entryDate": journal.entry_date.isoformat(),
+            "userId": str(user_id),
+            "tags": list(tag_ids),
+            "categories": list(category_ids),
+        }
+
+        publish_to_queue(db, "", "entry_queue", journal_dict)
 
-    await db.execute(
-        delete(JournalEntryTag).filter_by(journal_entry_id=journal_id)
+    await db.commit()
+    await response_cache.invalidate_user(user_id)
+    await summary_cache.invalidate_months(user_id, [daily_stats.to_utc_day(journal.entry_date)])
+
+    if content_changed:
+        notify_outbox()
+
+    return {"message": "Journal updated successfully"}, status.HTTP_200_OK
+
+
+async def autosave_draft(
+    db: AsyncSession,
+    draft_data: DraftSchema,
+    user_id: str,
+    journal_id: str,
+):
+    result = await db.execute(
+        select(exists().where(JournalEntry.id == journal_id, JournalEntry.user_id == user_id))
     )
-    await db.execute(
-        delete(JournalEntryCategory).filter_by(journal_entry_id=journal_id)
+    if not result.scalar():
+        raise HTTPException(status_code=404, detail="Journal entry not found")
+
+    # Redis only; the scheduler persists the draft once it settles
+    draft = await drafts.save_draft(journal_id, user_id, draft_data.title, draft_data.content)
+
+    return {"message": "Draft saved", "savedAt": draft["savedAt"]}, status.HTTP_200_OK
+
+
+async def get_draft(
+    user_id: str,
+    journal_id: str,
+):
+    draft = await drafts.load_draft(journal_id, user_id)
+
+    if not draft:
+        raise HTTPException(status_code=404, detail="Draft not found")
+
+    return {"draft": draft}, status.HTTP_200_OK
+
+
+async def save_draft(
+    db: AsyncSession,
+    user_id: str,
+    journal_id: str,
+):
+    draft = await drafts.load_draft(journal_id, user_id)
+
+    if not draft:
+        raise HTTPException(status_code=404, detail="Draft not found")
+
+    if not await drafts.flush_draft(db, user_id, journal_id):
+        raise HTTPException(status_code=404, detail="Journal entry not found")
+
+    return {"message": "Draft saved to journal"}, status.HTTP_200_OK
+
+
+IMPORT_CHUNK_SIZE = 200
+IMPORT_PROGRESS_LINES = 1000
+IMPORT_MAX_LINE_BYTES = 1024 * 1024
+IMPORT_SPOOL_MEMORY_BYTES = 8 * 1024 * 1024
+IMPORT_READ_BYTES = 64 * 1024
+EXPORT_BATCH_SIZE = 500
+
+LISTING_FIELDS = ("id", "user_id", "entry_date", "title", "summary", "excerpt", "categories", "tags")
+DEFAULT_LISTING_FIELDS = ("id", "user_id", "entry_date", "categories", "tags")
+LISTING_EXCERPT_LENGTH = 200
+
+# Must match the configuration of the journal_entries.search_vector generated column
+SEARCH_CONFIG = literal_column("'english'::regconfig")
+# ts_headline marks matches with control-character sentinels; snippet_html() escapes
+# the content and only then turns them into <mark> tags
+SEARCH_MATCH_START = "\x02"
+SEARCH_MATCH_STOP = "\x03"
+SEARCH_HEADLINE_OPTIONS = f'StartSel="{SEARCH_MATCH_START}", StopSel="{SEARCH_MATCH_STOP}", MaxWords=35, MinWords=15, MaxFragments=2'
+
+
+async def spool_upload(stream: AsyncIterator[bytes]):
+    """Read the request body into a spooled temp file before the StreamingResponse starts."""
+    upload = tempfile.SpooledTemporaryFile(max_size=IMPORT_SPOOL_MEMORY_BYTES)
+    try:
+        async for data in stream:
+            upload.write(data)
+    except BaseException:
+        upload.close()
+        raise
+    upload.seek(0)
+    return upload
+
+
+async def read_spooled(upload) -> AsyncIterator[bytes]:
+    try:
+        while data := upload.read(IMPORT_READ_BYTES):
+            yield data
+    finally:
+        upload.close()
+
+
+async def import_journal_entries(
+    db: AsyncSession,
+    stream: AsyncIterator[bytes],
+    user_id: str,
+) -> AsyncIterator[str]:
+    """Load NDJSON entries in fixed-size chunks, yielding one progress line per chunk."""
+    chunk: List[ImportJournalEntrySchema] = []
+    chunk_lines: List[int] = []
+    errors: List[dict] = []
+    progress = {"chunk": 0, "imported": 0, "failed": 0}
+    line_number = 0
+    lines_since_flush = 0
+    buffer = b""
+    oversized = False
+
+    def parse_line(raw: bytes):
+        if not raw.strip():
+            return
+        try:
+            chunk.append(ImportJournalEntrySchema.model_validate_json(raw))
+            chunk_lines.append(line_number)
+        except ValidationError as e:
+            progress["failed"] += 1
+            errors.append({"line": line_number, "error": e.errors(include_url=False)[0]["msg"]})
+
+    async def flush_chunk() -> str:
+        progress["chunk"] += 1
+        try:
+            progress["imported"] += await _import_chunk(db, chunk, user_id)
+        except Exception:
+            await db.rollback()
+            logger.exception(f"Import chunk {progress['chunk']} failed for user {user_id}")
+            progress["failed"] += len(chunk)
+            errors.append({"lines": [chunk_lines[0], chunk_lines[-1]], "error": "Failed to import entries"})
+
+        line = json.dumps({**progress, "errors": list(errors)}) + "\n"
+        chunk.clear()
+        chunk_lines.clear()
+        errors.clear()
+        return line
+
+    def reject_oversized():
+        progress["failed"] += 1
+        errors.append({"line": line_number, "error": f"Line exceeds {IMPORT_MAX_LINE_BYTES} bytes"})
+
+    async for data in stream:
+        buffer += data
+        *lines, buffer = buffer.split(b"\n")
+        for raw in lines:
+            line_number += 1
+            lines_since_flush += 1
+            if oversized or len(raw) > IMPORT_MAX_LINE_BYTES:
+                reject_oversized()
+                oversized = False
+            else:
+                parse_line(raw)
+            if len(chunk) >= IMPORT_CHUNK_SIZE or lines_since_flush >= IMPORT_PROGRESS_LINES:
+                lines_since_flush = 0
+                yield await flush_chunk()
+
+        # Drop the rest of an overlong line as it arrives instead of buffering it
+        if len(buffer) > IMPORT_MAX_LINE_BYTES:
+            oversized = True
+            buffer = b""
+
+    if oversized or buffer:
+        line_number += 1
+        if oversized or len(buffer) > IMPORT_MAX_LINE_BYTES:
+            reject_oversized()
+        else:
+            parse_line(buffer)
+
+    if chunk or errors:
+        yield await flush_chunk()
+
+
+async def _import_chunk(
+    db: AsyncSession,
+    entries: List[ImportJournalEntrySchema],
+    user_id: str,
+) -> int:
+    if not entries:
+        return 0
+
+    now = datetime.now()
+    rows = [
+        {
+            "id": uuid4(),
+            "title": entry.title or "",
+            "content": entry.content,
+            "content_hash": content_hash(entry.content),
+            "user_id": user_id,
+            "entry_date": entry.entry_date,
+            "created_at": now,
+            "updated_at": now,
+        }
+        for entry in entries
+    ]
+    await db.execute(insert(JournalEntry), rows)
+
+    # Bulk links skip link_entry's re-check, so resolve against the table itself
+    tag_ids = await tag_resolver.resolve_tags(
+        db, [name for entry in entries for name in entry.tags or []], user_id, use_cache=False
+    )
+    category_ids = await tag_resolver.resolve_categories(
+        db, [name for entry in entries for name in entry.categories or []], user_id, use_cache=False
     )
 
-    # Handle updated tags
-    for tag_name in update_data.tags:
-        tag_name = tag_name.lower()
-        result = await db.execute(
-            select(Tag).filter_by(name=tag_name, user_id=user_id)
-        )
-        tag = result.scalars().first()
-        if not tag:
-            tag = Tag(name=tag_name, user_id=user_id)
-            db.add(tag)
-            await db.flush()
-        db.add(JournalEntryTag(journal_entry_id=journal_id, tag_id=tag.id))
-
-    # Handle updated categories
-    for category_name in update_data.categories:
-        category_name = category_name.lower()
-        result = await db.execute(
-            select(Category).filter_by(name=category_name, user_id=user_id)
+    journal_dicts = []
+    tag_rows = set()
+    category_rows = set()
+    for row, entry in zip(rows, entries):
+        entry_tags = [n for n in map(tag_resolver.normalize_name, entry.tags or []) if n in tag_ids]
+        entry_categories = [n for n in map(tag_resolver.normalize_name, entry.categories or []) if n in category_ids]
+
+        tag_rows.update((row["id"], tag_ids[name]) for name in entry_tags)
+        category_rows.update((row["id"], category_ids[name]) for name in entry_categories)
+
+        journal_dicts.append({
+            "id": str(row["id"]),
+            "title": row["title"],
+            "content": row["content"],
+            "entryDate": row["entry_date"].isoformat(),
+            "userId": str(user_id),
+            "tags": list(dict.fromkeys(entry_tags)),
+            "categories": list(dict.fromkeys(entry_categories)),
+        })
+
+    if tag_rows:
+        await db.execute(
+            insert(JournalEntryTag).on_conflict_do_nothing(),
+            [{"journal_entry_id": j, "tag_id": t} for j, t in tag_rows]
+        )
+    if category_rows:
+        await db.execute(
+            insert(JournalEntryCategory).on_conflict_do_nothing(),
+            [{"journal_entry_id": j, "category_id": c} for j, c in category_rows]
         )
-        category = result.scalars().first()
-        if not category:
-            category = Category(name=category_name, user_id=user_id)
-            db.add(category)
-            await db.flush()
-        db.add(JournalEntryCategory(journal_entry_id=journal_id, category_id=category.id))
+
+    # One analysis message per entry, so each delivery stays short enough to ack in time
+    await publish_many_to_queue(db, "", "entry_queue", journal_dicts)
 
     await db.commit()
+    await response_cache.invalidate_user(user_id)
+    await summary_cache.invalidate_months(user_id, {daily_stats.to_utc_day(row["entry_date"]) for row in rows})
+    notify_outbox()
 
-    # Reload updated entry with relations
-    result = await db.execute(
-        select(JournalEntry)
-        .options(
-            selectinload(JournalEntry.tags),
-            selectinload(JournalEntry.categories),
+    return len(rows)
+
+
+EXPORT_CSV_COLUMNS = [
+    "id", "title", "entry_date", "created_at", "updated_at", "summary", "content",
+    "tags", "categories", "mood", "score", "magnitude",
+    "word_count", "sentence_count", "reading_time", "time_of_day",
+]
+
+
+async def export_journal_entries(
+    db: AsyncSession,
+    user_id: str,
+    format: str = "ndjson",
+) -> AsyncIterator[str]:
+    """Stream every entry of a user as NDJSON or CSV, one chunk per cursor batch."""
+    result = await db.stream(
+        select(
+            JournalEntry.id,
+            JournalEntry.title,
+            JournalEntry.entry_date,
+            JournalEntry.created_at,
+            JournalEntry.updated_at,
+            JournalEntry.summary,
+            JournalEntry.content,
         )
-        .filter(JournalEntry.id == journal_id)
+        .filter(JournalEntry.user_id == user_id)
+        .order_by(JournalEntry.entry_date.asc(), JournalEntry.id.asc())
+        .execution_options(yield_per=EXPORT_BATCH_SIZE)
     )
-    journal = result.scalars().first()
 
-    journal_dict = {
-        "id": str(journal.id),
-        "title": journal.title,
-        "content": journal.content,
-        "entryDate": journal.entry_date.isoformat(),
-        "userId": str(journal.user_id),
-        "tags": [tag.name for tag in journal.tags],
-        "categories": [cat.name for cat in journal.categories],
-    }
+    if format == "csv":
+        yield ",".join(EXPORT_CSV_COLUMNS) + "\r\n"
 
-    publish_to_queue("", "entry_queue", journal_dict)
+    async for journals in result.partitions():
+        journal_ids = [journal.id for journal in journals]
+        tags = await _entry_names(db, JournalEntryTag.tag_id, Tag, journal_ids)
+        categories = await _entry_names(db, JournalEntryCategory.category_id, Category, journal_ids)
 
-    return {"message": "Journal updated successfully"}, status.HTTP_200_OK
+        sentiment_result = await db.execute(
+            select(SentimentScore.journal_id, SentimentScore.mood, SentimentScore.score, SentimentScore.magnitude)
+            .where(SentimentScore.journal_id.in_(journal_ids))
+        )
+        sentiments = {
+            row.journal_id: {"mood": row.mood.value if row.mood else None, "score": row.score, "magnitude": row.magnitude}
+            for row in sentiment_result.all()
+        }
+
+        analytics_result = await db.execute(
+            select(
+                AnalyticsData.journal_id,
+                AnalyticsData.word_count,
+                AnalyticsData.sentence_count,
+                AnalyticsData.reading_time,
+                AnalyticsData.time_of_day,
+            )
+            .where(AnalyticsData.journal_id.in_(journal_ids))
+        )
+        analytics = {
+            row.journal_id: {
+                "word_count": row.word_count,
+                "sentence_count": row.sentence_count,
+                "reading_time": row.reading_time,
+                "time_of_day": row.time_of_day.value if row.time_of_day else None,
+            }
+            for row in analytics_result.all()
+        }
+
+        records = [
+            {
+                "id": str(journal.id),
+                "title": journal.title,
+                "entry_date": journal.entry_date.isoformat(),
+                "created_at": journal.created_at.isoformat(),
+                "updated_at": journal.updated_at.isoformat(),
+                "summary": journal.summary,
+                "content": journal.content,
+                "tags": tags[journal.id],
+                "categories": categories[journal.id],
+                "sentiment": sentiments.get(journal.id),
+                "analytics": analytics.get(journal.id),
+            }
+            for journal in journals
+        ]
+
+        if format == "csv":
+            buffer = io.StringIO()
+            writer = csv.writer(buffer)
+            for record in records:
+                sentiment = record["sentiment"] or {}
+                stats = record["analytics"] or {}
+                writer.writerow([
+                    record["id"], record["title"], record["entry_date"], record["created_at"],
+                    record["updated_at"], record["summary"], record["content"],
+                    ";".join(tag["name"] for tag in record["tags"]),
+                    ";".join(category["name"] for category in record["categories"]),
+                    sentiment.get("mood"), sentiment.get("score"), sentiment.get("magnitude"),
+                    stats.get("word_count"), stats.get("sentence_count"), stats.get("reading_time"),
+                    stats.get("time_of_day"),
+                ])
+            yield buffer.getvalue()
+        else:
+            yield "".join(json.dumps(record) + "\n" for record in records)
 
 
 async def delete_journal_entry(
@@ -445,54 +959,337 @@ async def delete_journal_entry(
     journal_id: str,
     user_id: str,
 ):
-
+    # Associations, sentiment and analytics go with it via ON DELETE CASCADE
     result = await db.execute(
-        select(JournalEntry).filter_by(id=journal_id, user_id=user_id)
+        delete(JournalEntry)
+        .where(JournalEntry.id == journal_id, JournalEntry.user_id == user_id)
+        .returning(JournalEntry.id, JournalEntry.entry_date, *daily_stats.entry_stat_days())
+        .execution_options(synchronize_session=False)
     )
-    journal = result.scalars().first()
+    deleted = result.first()
 
-    if not journal:
+    if not deleted:
         raise HTTPException(status_code=404, detail="Entry not found")
 
-    await db.execute(
-        delete(JournalEntry).filter_by(id=journal_id, user_id=user_id)
-    )
+    stat_days = daily_stats.days_of([deleted])
+    await daily_stats.refresh_days(db, user_id, stat_days)
     await db.commit()
+    await response_cache.invalidate_user(user_id)
+    await summary_cache.invalidate_months(user_id, {*stat_days, daily_stats.to_utc_day(deleted.entry_date)})
+    await drafts.discard_drafts(user_id, [deleted.id])
 
     return {"message": "Entry deleted"}, status.HTTP_200_OK
 
+def entry_filter_conditions(
+    start_date=None,
+    end_date=None,
+    tag_ids=None,
+    category_ids=None,
+    moods=None,
+    min_score=None,
+    max_score=None,
+) -> list:
+    conditions = []
+    if start_date:
+        conditions.append(JournalEntry.entry_date >= start_date)
+    if end_date:
+        conditions.append(JournalEntry.entry_date <= end_date)
+    if tag_ids:
+        conditions.append(
+            exists().where(
+                JournalEntryTag.journal_entry_id == JournalEntry.id,
+                JournalEntryTag.tag_id.in_(tag_ids)
+            )
+        )
+    if category_ids:
+        conditions.append(
+            exists().where(
+                JournalEntryCategory.journal_entry_id == JournalEntry.id,
+                JournalEntryCategory.category_id.in_(category_ids)
+            )
+        )
+
+    # One probe of the unique sentiment_scores.journal_id index covers mood and score together
+    sentiment_conditions = []
+    if moods:
+        sentiment_conditions.append(SentimentScore.mood.in_(moods))
+    if min_score is not None:
+        sentiment_conditions.append(SentimentScore.score >= min_score)
+    if max_score is not None:
+        sentiment_conditions.append(SentimentScore.score <= max_score)
+    if sentiment_conditions:
+        conditions.append(
+            exists().where(
+                SentimentScore.journal_id == JournalEntry.id,
+                *sentiment_conditions
+            )
+        )
+    return conditions
+
+
+def filter_schema_conditions(filters: Optional[EntryFilterSchema]) -> list:
+    if filters is None:
+        return []
+    return entry_filter_conditions(
+        start_date=filters.start_date,
+        end_date=filters.end_date,
+        tag_ids=filters.tag_ids,
+        category_ids=filters.category_ids,
+        moods=filters.moods,
+        min_score=filters.min_score,
+        max_score=filters.max_score,
+    )
+
+
+def _batch_targets(data: BatchEntriesSchema, user_id: str):
+    stmt = select(JournalEntry.id).where(JournalEntry.user_id == user_id)
+    if data.entry_ids:
+        stmt = stmt.where(JournalEntry.id.in_(data.entry_ids))
+    if data.filter:
+        stmt = stmt.where(*filter_schema_conditions(data.filter))
+    return stmt
+
+
+async def batch_delete_journal_entries(
+    db: AsyncSession,
+    data: BatchEntriesSchema,
+    user_id: str,
+):
+    # Associations, sentiment and analytics go with them via ON DELETE CASCADE
+    result = await db.execute(
+        delete(JournalEntry)
+        .where(JournalEntry.id.in_(_batch_targets(data, user_id)))
+        .returning(JournalEntry.id, JournalEntry.entry_date, *daily_stats.entry_stat_days())
+        .execution_options(synchronize_session=False)
+    )
+    rows = result.all()
+    deleted = len(rows)
+
+    stat_days = daily_stats.days_of(rows)
+    await daily_stats.refresh_days(db, user_id, stat_days)
+    await db.commit()
+    await response_cache.invalidate_user(user_id)
+    await summary_cache.invalidate_months(user_id, {*stat_days, *(daily_stats.to_utc_day(row.entry_date) for row in rows)})
+    await drafts.discard_drafts(user_id, [row.id for row in rows])
+
+    return {"message": "Entries deleted", "deleted": deleted}, status.HTTP_200_OK
+
+
+async def batch_retag_journal_entries(
+    db: AsyncSession,
+    data: BatchRetagEntriesSchema,
+    user_id: str,
+):
+    targets = _batch_targets(data, user_id)
+    counts = {"tagsAdded": 0, "tagsRemoved": 0, "categoriesAdded": 0, "categoriesRemoved": 0}
+
+    if data.add_tags:
+        tag_ids = await tag_resolver.resolve_tags(db, data.add_tags, user_id, use_cache=False)
+        result = await db.execute(
+            insert(JournalEntryTag)
+            .from_select(
+                ["journal_entry_id", "tag_id"],
+                select(JournalEntry.id, Tag.id).where(
+                    JournalEntry.id.in_(targets),
+                    Tag.id.in_(list(tag_ids.values()))
+                )
+            )
+            .on_conflict_do_nothing()
+        )
+        counts["tagsAdded"] = result.rowcount
+
+    if data.remove_tags:
+        names = [tag_resolver.normalize_name(name) for name in data.remove_tags if name.strip()]
+        result = await db.execute(
+            delete(JournalEntryTag)
+            .where(
+                JournalEntryTag.journal_entry_id.in_(targets),
+                JournalEntryTag.tag_id.in_(
+                    select(Tag.id).where(Tag.user_id == user_id, Tag.name.in_(names))
+                )
+            )
+            .execution_options(synchronize_session=False)
+        )
+        counts["tagsRemoved"] = result.rowcount
+
+    if data.set_categories is not None:
+        category_ids = list((await tag_resolver.resolve_categories(db, data.set_categories, user_id, use_cache=False)).values())
+
+        stmt = delete(JournalEntryCategory).where(JournalEntryCategory.journal_entry_id.in_(targets))
+        if category_ids:
+            stmt = stmt.where(JournalEntryCategory.category_id.not_in(category_ids))
+        result = await db.execute(stmt.execution_options(synchronize_session=False))
+        counts["categoriesRemoved"] = result.rowcount
+
+        if category_ids:
+            result = await db.execute(
+                insert(JournalEntryCategory)
+                .from_select(
+                    ["journal_entry_id", "category_id"],
+                    select(JournalEntry.id, Category.id).where(
+                        JournalEntry.id.in_(targets),
+                        Category.id.in_(category_ids)
+                    )
+                )
+                .on_conflict_do_nothing()
+            )
+            counts["categoriesAdded"] = result.rowcount
+
+    if any(counts.values()):
+        await _touch_entries(db, targets)
+
+    await db.commit()
+    await response_cache.invalidate_user(user_id)
+    if counts["categoriesAdded"] or counts["categoriesRemoved"]:
+        await summary_cache.invalidate_user(user_id)
+
+    return {"message": "Entries updated", **counts}, status.HTTP_200_OK
+
+
+def _entries_page(stmt, page: int, limit: int, cursor: Optional[str]):
+    stmt = stmt.order_by(JournalEntry.entry_date.desc(), JournalEntry.id.desc()).limit(limit)
+
+    # Keyset paging seeks straight to (entry_date, id) instead of scanning past OFFSET rows
+    if cursor is None:
+        stmt = stmt.offset((page - 1) * limit)
+    elif cursor:
+        entry_date, id_ = _parse_cursor(cursor, datetime.fromisoformat, UUID)
+        stmt = stmt.filter(tuple_(JournalEntry.entry_date, JournalEntry.id) < (entry_date, id_))
+
+    return stmt
+
+
+def _entry_versions():
+    """Columns that change whenever a rendered entry does: the entry itself and its analysis."""
+    return (
+        select(
+            JournalEntry.id,
+            JournalEntry.updated_at,
+            AnalyticsData.updated_at,
+            AnalyticsData.analysis_version,
+        )
+        .outerjoin(AnalyticsData, AnalyticsData.journal_id == JournalEntry.id)
+    )
+
+
+async def get_journal_entries_etag(
+    db: AsyncSession,
+    user_id: str,
+    page: int = 1,
+    limit: int = 10,
+    cursor: Optional[str] = None,
+    fields: Optional[List[str]] = None,
+    filters: Optional[EntryFilterSchema] = None,
+) -> str:
+    result = await db.execute(
+        _entries_page(
+            _entry_versions().filter(JournalEntry.user_id == user_id, *filter_schema_conditions(filters)),
+            page, limit, cursor
+        )
+    )
+    return make_etag("entries", cursor is None, limit, _listing_fields(fields), *result.all())
+
+
+async def get_journal_entry_etag(
+        db: AsyncSession,
+        journal_id: str,
+        user_id: str,
+) -> Optional[str]:
+    result = await db.execute(
+        _entry_versions().filter(JournalEntry.id == journal_id, JournalEntry.user_id == user_id)
+    )
+    version = result.first()
+    return make_etag("entry", *version) if version else None
+
+
+def _listing_fields(fields: Optional[List[str]]) -> List[str]:
+    if not fields:
+        return list(DEFAULT_LISTING_FIELDS)
+
+    unknown = set(fields) - set(LISTING_FIELDS)
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown fields: {', '.join(sorted(unknown))}"
+        )
+    return [field for field in LISTING_FIELDS if field in fields]
+
+
+async def _entry_names(db: AsyncSession, link_column, model, journal_ids: List[UUID]) -> dict:
+    """{journal_id: [{id, name}]} for a page of entries, in one query per relationship."""
+    names = {journal_id: [] for journal_id in journal_ids}
+    if not journal_ids:
+        return names
+
+    association = link_column.class_
+    result = await db.execute(
+        select(association.journal_entry_id, model.id, model.name)
+        .join(model, model.id == link_column)
+        .where(association.journal_entry_id.in_(journal_ids))
+        .order_by(model.name)
+    )
+    for journal_id, id_, name in result.all():
+        names[journal_id].append({"id": str(id_), "name": name})
+    return names
+
+
 async def get_journal_entries(
     db: AsyncSession,
     user_id: str,
     page: int = Query(1, ge=1),
     limit: int = Query(10, le=100),
+    cursor: Optional[str] = None,
+    fields: Optional[List[str]] = None,
+    filters: Optional[EntryFilterSchema] = None,
 ):
-    offset = (page - 1) * limit
-
-    result = await db.execute(
-        select(JournalEntry)
-        .filter(JournalEntry.user_id == user_id)
-        .order_by(JournalEntry.entry_date.desc())
-        .offset(offset)
-        .limit(limit)
-        .options(
-            selectinload(JournalEntry.categories),
-            selectinload(JournalEntry.tags),
+    fields = _listing_fields(fields)
+
+    # Project only the requested columns; the full content never leaves Postgres
+    columns = {
+        "user_id": JournalEntry.user_id,
+        "title": JournalEntry.title,
+        "summary": JournalEntry.summary,
+        "excerpt": func.left(JournalEntry.content, LISTING_EXCERPT_LENGTH).label("excerpt"),
+    }
+    stmt = _entries_page(
+        select(
+            JournalEntry.id,
+            JournalEntry.entry_date,
+            *(column for field, column in columns.items() if field in fields)
         )
+        .filter(JournalEntry.user_id == user_id, *filter_schema_conditions(filters)),
+        page, limit, cursor
     )
 
-    journals: List[JournalEntry] = result.scalars().all()
+    result = await db.execute(stmt)
+    journals = result.all()
 
-    return [
-        {
+    journal_ids = [journal.id for journal in journals]
+    categories = await _entry_names(db, JournalEntryCategory.category_id, Category, journal_ids) if "categories" in fields else {}
+    tags = await _entry_names(db, JournalEntryTag.tag_id, Tag, journal_ids) if "tags" in fields else {}
+
+    entries = []
+    for journal in journals:
+        values = {
             "id": str(journal.id),
-            "user_id": str(journal.user_id),
             "entry_date": journal.entry_date.isoformat(),
-            "categories": [{"id": str(category.id), "name": category.name} for category in journal.categories],
-            "tags": [{"id": str(tag.id), "name": tag.name} for tag in journal.tags],
+            "categories": categories.get(journal.id),
+            "tags": tags.get(journal.id),
         }
-        for journal in journals
-    ], status.HTTP_200_OK
+        if "user_id" in fields:
+            values["user_id"] = str(journal.user_id)
+        for field in ("title", "summary", "excerpt"):
+            if field in fields:
+                values[field] = getattr(journal, field)
+        entries.append({field: values[field] for field in fields})
+
+    # The offset API keeps returning a bare list for existing clients
+    if cursor is None:
+        return entries, status.HTTP_200_OK
+
+    next_cursor = encode_cursor([journals[-1].entry_date.isoformat(), journals[-1].id]) if len(journals) == limit else None
+
+    return {"entries": entries, "nextCursor": next_cursor}, status.HTTP_200_OK
 
 
 async def get_journal_entry(
@@ -504,6 +1301,7 @@ async def get_journal_entry(
         select(JournalEntry)
         .filter_by(id=journal_id, user_id=user_id)
         .options(
+            undefer(JournalEntry.content),
             selectinload(JournalEntry.categories),
             selectinload(JournalEntry.tags)
         )
@@ -518,3 +1316,107 @@ async def get_journal_entry(
         raise HTTPException(status_code=400, detail="Categories or tags not loaded properly.")
 
     return {journal}, status.HTTP_200_OK
+
+
+async def batch_get_journal_entries(
+        db: AsyncSession,
+        data: BatchGetEntriesSchema,
+        user_id: str,
+):
+    entry_ids = list(dict.fromkeys(data.entry_ids))
+
+    # Ownership is part of the WHERE clause, so foreign ids read the same as missing ones
+    result = await db.execute(
+        select(JournalEntry)
+        .filter(JournalEntry.id.in_(entry_ids), JournalEntry.user_id == user_id)
+        .options(
+            undefer(JournalEntry.content),
+            selectinload(JournalEntry.categories),
+            selectinload(JournalEntry.tags)
+        )
+    )
+    journals = {journal.id: journal for journal in result.scalars().all()}
+
+    return {
+        "entries": [journals[id_] for id_ in entry_ids if id_ in journals],
+        "missing": [str(id_) for id_ in entry_ids if id_ not in journals],
+    }, status.HTTP_200_OK
+
+
+def snippet_html(snippet: Optional[str]) -> Optional[str]:
+    """HTML-escape a ts_headline snippet, then mark its matches."""
+    if snippet is None:
+        return None
+    return (
+        html.escape(snippet)
+        .replace(SEARCH_MATCH_START, "<mark>")
+        .replace(SEARCH_MATCH_STOP, "</mark>")
+    )
+
+
+async def search_journal_entries(
+        db: AsyncSession,
+        user_id: str,
+        query: str,
+        page: int = 1,
+        limit: int = 10,
+        tag_ids: Optional[List[UUID]] = None,
+        category_ids: Optional[List[UUID]] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+):
+    ts_query = func.websearch_to_tsquery(SEARCH_CONFIG, query)
+    rank = func.ts_rank_cd(JournalEntry.search_vector, ts_query)
+
+    # Rank and page over the GIN index first, then build snippets for the page only
+    ranked = (
+        select(JournalEntry.id, rank.label("rank"))
+        .filter(
+            JournalEntry.user_id == user_id,
+            JournalEntry.search_vector.op("@@")(ts_query),
+            *entry_filter_conditions(
+                start_date=start_date,
+                end_date=end_date,
+                tag_ids=tag_ids,
+                category_ids=category_ids,
+            )
+        )
+        .order_by(rank.desc(), JournalEntry.entry_date.desc())
+        .offset((page - 1) * limit)
+        .limit(limit)
+        .subquery()
+    )
+
+    result = await db.execute(
+        select(
+            JournalEntry.id,
+            JournalEntry.title,
+            JournalEntry.summary,
+            JournalEntry.entry_date,
+            ranked.c.rank,
+            func.ts_headline(
+                SEARCH_CONFIG,
+                JournalEntry.content,
+                ts_query,
+                SEARCH_HEADLINE_OPTIONS
+            ).label("snippet"),
+        )
+        .join(ranked, ranked.c.id == JournalEntry.id)
+        .order_by(ranked.c.rank.desc(), JournalEntry.entry_date.desc())
+    )
+
+    return {
+        "results": [
+            {
+                "id": str(row.id),
+                "title": row.title,
+                "summary": row.summary,
+                "entry_date": row.entry_date.isoformat(),
+                "rank": row.rank,
+                "snippet": snippet_html(row.snippet),
+            }
+            for row in result.all()
+        ],
+        "page": page,
+        "limit": limit,
+    }, status.HTTP_200_OK
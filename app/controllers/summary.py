@@ -1,21 +1,29 @@
-from fastapi import status, Query,HTTPException
+import asyncio
+
+from fastapi import status, Query
 
-from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy.orm import selectinload
 
-from typing import List, Dict, Optional
+from typing import List, Optional, Tuple
 
-from datetime import datetime
+from datetime import date, datetime, time, timedelta, timezone
 
-from sqlalchemy import func
+from sqlalchemy import and_, asc, desc, func, or_
 
 from collections import defaultdict
 
 from app.core.error_handler import logger
-from app.db.models import JournalEntry, SentimentScore, AnalyticsData, Category
+from app.db.models import JournalEntry, SentimentScore, AnalyticsData, Category, UserDailyStats
+from app.db.models.mood import Mood
+from app.db.session import AsyncSessionLocal
+from app.services import summary_cache
+from app.services.daily_stats import TIME_OF_DAY_COLUMNS, utc_day
 from app.utils.functions import get_week, get_overall_mood_per_day
 
+# Config
+# Connections a single summary or extremes request may hold at once
+SUMMARY_QUERY_CONCURRENCY = 4
+
 
 # Helper function to get the start and end dates from the query params
 def get_start_end_dates(start_date: Optional[str], end_date: Optional[str]):
@@ -32,118 +40,270 @@ def get_start_end_dates(start_date: Optional[str], end_date: Optional[str]):
     )
     return start, end
 
-async def get_journal_summary(
-    user_id: str,
-    db: AsyncSession,
-    start: Optional[str] = Query(default=None),
-    end: Optional[str] = Query(default=None),
-):
-    try:
-        start_date, end_date = get_start_end_dates(start, end)
+# A time range as (start, end, end_inclusive); month buckets exclude their end
+Range = Tuple[datetime, datetime, bool]
 
-        total_entries_result = await db.execute(
-            select(func.count(JournalEntry.id)).filter(
-                JournalEntry.user_id == user_id,
-                JournalEntry.entry_date >= start_date,
-                JournalEntry.entry_date <= end_date,
-            )
-        )
-        total_entries = total_entries_result.scalar()
 
-        if total_entries == 0:
-            return {"message": "No entries found"}, 404
+def _within(column, start: datetime, end: datetime, end_inclusive: bool = True):
+    return and_(column >= start, column <= end if end_inclusive else column < end)
 
-        analytics_result = await db.execute(
-            select(AnalyticsData)
-            .join(JournalEntry)
+
+def as_utc(value: datetime) -> datetime:
+    """Normalize to UTC; naive times are taken as UTC."""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def _next_month(month: date) -> date:
+    return date(month.year + month.month // 12, month.month % 12 + 1, 1)
+
+
+def split_range(start_date: datetime, end_date: datetime) -> Tuple[List[Range], List[date]]:
+    """Split [start_date, end_date] into whole past months (cached) and live ranges."""
+    current_month = summary_cache.month_of(datetime.now(timezone.utc).date())
+    live_ranges: List[Range] = []
+    months: List[date] = []
+
+    cursor = start_date
+    while cursor <= end_date:
+        month = summary_cache.month_of(cursor.date())
+        month_end = datetime.combine(_next_month(month), time.min, tzinfo=cursor.tzinfo)
+
+        if cursor == datetime.combine(month, time.min, tzinfo=cursor.tzinfo) and month_end <= end_date and month < current_month:
+            months.append(month)
+        elif month_end <= end_date:
+            live_ranges.append((cursor, month_end, False))
+        else:
+            live_ranges.append((cursor, end_date, True))
+        cursor = month_end
+
+    return live_ranges, months
+
+
+async def read_all(slots: asyncio.Semaphore, stmt) -> list:
+    """Run one summary read on its own pooled session."""
+    async with slots:
+        async with AsyncSessionLocal() as db:
+            result = await db.execute(stmt)
+            return result.all()
+
+
+async def get_daily_stats(slots: asyncio.Semaphore, user_id: str, ranges: List[Range]) -> list:
+    """Per-day entry, word and time-of-day totals within the ranges."""
+    rollup_days = []
+    live_ranges = []
+    for start_date, end_date, end_inclusive in ranges:
+        full_start = start_date.date() if start_date.time() == time.min else start_date.date() + timedelta(days=1)
+        full_end = end_date.date()
+
+        if full_start < full_end:
+            full_start_at = datetime.combine(full_start, time.min, tzinfo=start_date.tzinfo)
+            full_end_at = datetime.combine(full_end, time.min, tzinfo=end_date.tzinfo)
+            rollup_days.append(and_(UserDailyStats.day >= full_start, UserDailyStats.day < full_end))
+            live_ranges.append(_within(AnalyticsData.entry_date, start_date, full_start_at, False))
+            live_ranges.append(_within(AnalyticsData.entry_date, full_end_at, end_date, end_inclusive))
+        else:
+            live_ranges.append(_within(AnalyticsData.entry_date, start_date, end_date, end_inclusive))
+
+    statements = []
+    if rollup_days:
+        statements.append(
+            select(
+                UserDailyStats.day,
+                UserDailyStats.entries,
+                UserDailyStats.words,
+                *(getattr(UserDailyStats, column) for column in TIME_OF_DAY_COLUMNS.values()),
+            )
             .filter(
-                JournalEntry.user_id == user_id,
-                AnalyticsData.entry_date >= start_date,
-                AnalyticsData.entry_date <= end_date,
+                UserDailyStats.user_id == user_id,
+                UserDailyStats.entries > 0,
+                or_(*rollup_days),
             )
-            .options(selectinload(AnalyticsData.journal_entry))
         )
 
+    # One row per day, with the time-of-day split as FILTER aggregates
+    day = utc_day(AnalyticsData.entry_date).label("day")
+    statements.append(
+        select(
+            day,
+            func.count().label("entries"),
+            func.sum(AnalyticsData.word_count).label("words"),
+            *(
+                func.count().filter(AnalyticsData.time_of_day == time_of_day).label(column)
+                for time_of_day, column in TIME_OF_DAY_COLUMNS.items()
+            ),
+        )
+        .join(JournalEntry)
+        .filter(JournalEntry.user_id == user_id, or_(*live_ranges))
+        .group_by(day)
+    )
 
-        analytics = analytics_result.scalars().all()
+    results = await asyncio.gather(*(read_all(slots, stmt) for stmt in statements))
+    return [row for rows in results for row in rows]
 
-        for entry in analytics:
-            print(f"Entry: {entry.id}, word_count: {entry.word_count}, date: {entry.entry_date.date()}")
 
-        print(analytics, 'someresult', total_entries, get_week(end_date))
-        sentiment_result = await db.execute(
-            select(SentimentScore)
+async def get_summary_bucket(slots: asyncio.Semaphore, user_id: str, ranges: List[Range]) -> dict:
+    """Mergeable partial aggregates of the summary over the ranges."""
+    total_entries_rows, daily_stats, sentiment_data, category_distribution = await asyncio.gather(
+        read_all(
+            slots,
+            select(func.count(JournalEntry.id)).filter(
+                JournalEntry.user_id == user_id,
+                or_(*(_within(JournalEntry.entry_date, *range_) for range_ in ranges)),
+            )
+        ),
+        get_daily_stats(slots, user_id, ranges),
+        read_all(
+            slots,
+            select(
+                utc_day(SentimentScore.created_at),
+                SentimentScore.mood,
+                SentimentScore.score,
+            )
             .join(JournalEntry)
             .filter(
                 JournalEntry.user_id == user_id,
-                SentimentScore.created_at >= start_date,
-                SentimentScore.created_at <= end_date,
+                or_(*(_within(SentimentScore.created_at, *range_) for range_ in ranges)),
             )
-        )
-        sentiment_data = sentiment_result.scalars().all()
+            .order_by(SentimentScore.created_at)
+        ),
+        read_all(
+            slots,
+            select(Category.id, Category.name, func.count(Category.id))
+            .join(JournalEntry.categories)
+            .filter(
+                JournalEntry.user_id == user_id,
+                or_(*(_within(JournalEntry.entry_date, *range_) for range_ in ranges)),
+            )
+            .group_by(Category.id)
+        ),
+    )
+
+    return {
+        "total_entries": total_entries_rows[0][0],
+        "days": [
+            [stats.day.isoformat(), stats.entries, stats.words, *(stats._mapping[column] for column in TIME_OF_DAY_COLUMNS.values())]
+            for stats in daily_stats
+        ],
+        "sentiment": [
+            [day.isoformat(), mood.value if mood else None, score]
+            for day, mood, score in sentiment_data
+        ],
+        "categories": [
+            [str(id_), name, count]
+            for id_, name, count in category_distribution
+        ],
+    }
+
+
+def merge_summary_buckets(buckets: List[dict]) -> dict:
+    categories = {}
+    for bucket in buckets:
+        for id_, name, count in bucket["categories"]:
+            categories[id_] = (name, categories.get(id_, (name, 0))[1] + count)
 
+    # Each day falls in exactly one bucket, so a stable sort by day keeps created_at order within it
+    return {
+        "total_entries": sum(bucket["total_entries"] for bucket in buckets),
+        "days": sorted((row for bucket in buckets for row in bucket["days"]), key=lambda row: row[0]),
+        "sentiment": sorted((row for bucket in buckets for row in bucket["sentiment"]), key=lambda row: row[0]),
+        "categories": [[id_, name, count] for id_, (name, count) in categories.items()],
+    }
 
 
-        avg_word_count = sum(entry.word_count for entry in analytics) / total_entries if total_entries else 0
+async def get_journal_summary(
+    user_id: str,
+    start: Optional[str] = Query(default=None),
+    end: Optional[str] = Query(default=None),
+):
+    try:
+        start_date, end_date = map(as_utc, get_start_end_dates(start, end))
+
+        # Whole past months come from Redis; only the edges and the current month hit Postgres
+        live_ranges, months = split_range(start_date, end_date)
+        cache_keys, buckets = await summary_cache.load_months(user_id, months)
+
+        # Missed months and the live ranges are computed concurrently, within the read cap
+        missed_months = [month for month in months if month not in buckets]
+        bucket_ranges = [
+            [(
+                datetime.combine(month, time.min, tzinfo=timezone.utc),
+                datetime.combine(_next_month(month), time.min, tzinfo=timezone.utc),
+                False,
+            )]
+            for month in missed_months
+        ]
+        if live_ranges:
+            bucket_ranges.append(live_ranges)
+        slots = asyncio.Semaphore(SUMMARY_QUERY_CONCURRENCY)
+        computed = await asyncio.gather(*(get_summary_bucket(slots, user_id, ranges) for ranges in bucket_ranges))
+
+        missed = dict(zip(missed_months, computed))
+        await summary_cache.store_months(cache_keys, missed)
+
+        merged = merge_summary_buckets([*buckets.values(), *computed])
+
+        total_entries = merged["total_entries"]
+        if total_entries == 0:
+            return {"message": "No entries found"}, 404
+
+        daily_stats = [
+            (date.fromisoformat(day), entries, words, dict(zip(TIME_OF_DAY_COLUMNS, time_of_day_counts)))
+            for day, entries, words, *time_of_day_counts in merged["days"]
+        ]
+        sentiment_data = [
+            (day, Mood(mood) if mood else None, score)
+            for day, mood, score in merged["sentiment"]
+        ]
+        category_distribution = merged["categories"]
+
+        total_words = sum(words for _, _, words, _ in daily_stats)
+        avg_word_count = total_words / total_entries if total_entries else 0
 
-        word_count_trends = defaultdict(int)
         total_words_per_year = defaultdict(int)
         total_words_per_week = defaultdict(int)
         total_entries_per_year = defaultdict(int)
         total_entries_per_week = defaultdict(int)
-        grouped_entries = defaultdict(int)
         time_of_day_analysis = defaultdict(int)
 
-        for entry in analytics:
-            entry_date = entry.entry_date.date()
-            word_count_trends[entry_date.isoformat()] += entry.word_count
-
-            year, week = get_week(entry.entry_date)
-
+        # Folding O(days) aggregate rows instead of one ORM object per entry
+        for day, entries, words, time_of_day_counts in daily_stats:
+            year, week = get_week(day)
 
-            total_words_per_year[year] += entry.word_count
-            total_words_per_week[week] += entry.word_count
-            total_entries_per_year[year] += 1
-            total_entries_per_week[week] += 1
-            grouped_entries[entry_date.isoformat()] += 1
+            total_words_per_year[year] += words
+            total_words_per_week[week] += words
+            total_entries_per_year[year] += entries
+            total_entries_per_week[week] += entries
 
-            if entry.time_of_day:
-                time_of_day_analysis[entry.time_of_day] += 1
+            for time_of_day, count in time_of_day_counts.items():
+                if count:
+                    time_of_day_analysis[time_of_day] += count
 
-        distinct_days_journaled = len(set(entry.entry_date.date() for entry in analytics))
+        word_count_trends = {day.isoformat(): words for day, _, words, _ in daily_stats}
+        grouped_entries = {day.isoformat(): entries for day, entries, _, _ in daily_stats}
+        distinct_days_journaled = len(daily_stats)
 
+        max_row = max(sentiment_data, key=lambda s: s[2], default=None)
+        min_row = min(sentiment_data, key=lambda s: s[2], default=None)
         mood_summary = {
-            "total_score": sum(s.score for s in sentiment_data),
-            "max_score": max((s.score for s in sentiment_data), default=float('-inf')),
-            "min_score": min((s.score for s in sentiment_data), default=float('inf')),
-            "max_mood": max(sentiment_data, key=lambda s: s.score).mood if sentiment_data else "",
-            "min_mood": min(sentiment_data, key=lambda s: s.score).mood if sentiment_data else "",
+            "total_score": sum(score for _, _, score in sentiment_data),
+            "max_score": max_row[2] if max_row else float('-inf'),
+            "min_score": min_row[2] if min_row else float('inf'),
+            "max_mood": max_row[1] if max_row else "",
+            "min_mood": min_row[1] if min_row else "",
         }
 
-
-
         mood_trends = [
             {
-                "date": s.created_at.date().isoformat(),
-                "mood": s.mood,
-                "score": s.score,
+                "date": day,
+                "mood": mood,
+                "score": score,
             }
-            for s in sentiment_data
+            for day, mood, score in sentiment_data
         ]
         overall_mood_per_day = get_overall_mood_per_day(mood_trends)
 
-        category_distribution_result = await db.execute(
-            select(Category.id, Category.name, func.count(Category.id))
-            .join(JournalEntry.categories)
-            .filter(
-                JournalEntry.user_id == user_id,
-                JournalEntry.entry_date >= start_date,
-                JournalEntry.entry_date <= end_date,
-            )
-            .group_by(Category.id)
-        )
-        category_distribution = category_distribution_result.all()
-
         category_distribution_with_names = [
             {
                 "categoryId": id_,
@@ -184,44 +344,66 @@ async def get_journal_summary(
         return {"error": str(error)}, status.HTTP_500_INTERNAL_SERVER_ERROR
 
 
+def top_sentiment(user_id: str, start_date: datetime, end_date: datetime, order, k: int):
+    """The k sentiment rows of the range in `order`, with their content."""
+    top = (
+        select(SentimentScore.journal_id, SentimentScore.mood, SentimentScore.score)
+        .join(JournalEntry)
+        .filter(
+            JournalEntry.user_id == user_id,
+            SentimentScore.created_at >= start_date,
+            SentimentScore.created_at <= end_date,
+        )
+        .order_by(order(SentimentScore.score), SentimentScore.journal_id)
+        .limit(k)
+        .subquery()
+    )
+    return (
+        select(top.c.journal_id, top.c.mood, top.c.score, JournalEntry.content)
+        .join(JournalEntry, JournalEntry.id == top.c.journal_id)
+        .order_by(order(top.c.score), top.c.journal_id)
+    )
+
+
 async def get_sentiment_extremes(
     user_id: str,
     start_date: str,
     end_date: str,
-    db: AsyncSession,
+    k: int = 1,
 ):
     try:
         start_date, end_date = get_start_end_dates(start_date, end_date)
 
-        sentiment_data = await db.execute(
-            select(SentimentScore)
-            .join(JournalEntry)
-            .filter(
-                JournalEntry.user_id == user_id,
-                SentimentScore.created_at >= start_date,
-                SentimentScore.created_at <= end_date,
-            )
-            .options(selectinload(SentimentScore.journal_entry))
+        slots = asyncio.Semaphore(SUMMARY_QUERY_CONCURRENCY)
+        positive, negative = await asyncio.gather(
+            read_all(slots, top_sentiment(user_id, start_date, end_date, desc, k)),
+            read_all(slots, top_sentiment(user_id, start_date, end_date, asc, k)),
         )
-        sentiment_data = sentiment_data.scalars().all()
-
-        most_positive = max(sentiment_data, key=lambda s: s.score, default=None)
-        most_negative = min(sentiment_data, key=lambda s: s.score, default=None)
 
-        if most_positive and most_negative:
+        if positive and negative:
+            top_positive = [
+                {
+                    "journal_id": str(journal_id),
+                    "mood": mood,
+                    "score": score,
+                    "content": content,
+                }
+                for journal_id, mood, score, content in positive
+            ]
+            top_negative = [
+                {
+                    "journal_id": str(journal_id),
+                    "mood": mood,
+                    "score": score,
+                    "content": content,
+                }
+                for journal_id, mood, score, content in negative
+            ]
             return {
-                "most_positive": {
-                    "journal_id": str(most_positive.journal_entry.id),
-                    "mood": most_positive.mood,
-                    "score": most_positive.score,
-                    "content": most_positive.journal_entry.content,
-                },
-                "most_negative": {
-                    "journal_id": str(most_negative.journal_entry.id),
-                    "mood": most_negative.mood,
-                    "score": most_negative.score,
-                    "content": most_negative.journal_entry.content,
-                },
+                "most_positive": top_positive[0],
+                "most_negative": top_negative[0],
+                "top_positive": top_positive,
+                "top_negative": top_negative,
             }, 200
         else:
             return {"message": "No sentiment data available for the given range"}, status.HTTP_404_NOT_FOUND
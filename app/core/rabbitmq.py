@@ -1,6 +1,8 @@
 import asyncio
 import json
-from aio_pika import connect_robust, Message, IncomingMessage, ExchangeType
+
+from typing import Optional
+from aio_pika import connect_robust, Message, IncomingMessage, ExchangeType, DeliveryMode
 
 
 from app.core.logger import logger
@@ -10,16 +12,26 @@ class RabbitMQ:
         self.url = url
         self.connection = None
         self.channel = None
-
-    async def connect(self):
-        try:
-            self.connection = await connect_robust(self.url)
-            self.channel = await self.connection.channel()
-            logger.info("[AMQP] Connected to RabbitMQ")
-        except Exception as e:
-            logger.error(f"[AMQP] Connection error: {e}")
-            await asyncio.sleep(1)
-            await self.connect()
+        self.declared_queues = set()
+        self._connect_lock = asyncio.Lock()
+
+    async def connect(self, max_attempts: Optional[int] = None):
+        """Open the shared connection, retrying every second."""
+        async with self._connect_lock:
+            attempt = 0
+            while not self.channel:
+                attempt += 1
+                try:
+                    self.connection = await connect_robust(self.url)
+                    # Publisher confirms make publish() wait until the broker has the message
+                    self.channel = await self.connection.channel(publisher_confirms=True)
+                    self.declared_queues = set()
+                    logger.info("[AMQP] Connected to RabbitMQ")
+                except Exception as e:
+                    logger.error(f"[AMQP] Connection error: {e}")
+                    if max_attempts is not None and attempt >= max_attempts:
+                        raise
+                    await asyncio.sleep(1)
 
     async def publish(self, queue_name: str, message_body: dict):
         if not self.channel:
@@ -28,14 +40,18 @@ class RabbitMQ:
         # Ensure the message body is a valid JSON string
         message_json = json.dumps(message_body)
 
-        await self.channel.declare_queue(queue_name, durable=True)
-        message = Message(body=message_json.encode())
+        if queue_name not in self.declared_queues:
+            await self.channel.declare_queue(queue_name, durable=True)
+            self.declared_queues.add(queue_name)
+
+        message = Message(body=message_json.encode(), delivery_mode=DeliveryMode.PERSISTENT)
         await self.channel.default_exchange.publish(message, routing_key=queue_name)
         logger.info(f"[AMQP] Published message to {queue_name}")
 
-    async def consume(self, queue_name: str, callback):
+    async def consume(self, queue_name: str, callback, prefetch_count: int = 10):
         if not self.channel:
             await self.connect()
+        await self.channel.set_qos(prefetch_count=prefetch_count)
         queue = await self.channel.declare_queue(queue_name, durable=True)
         logger.info(f"[AMQP] Consuming queue: {queue_name}")
         await queue.consume(callback)
@@ -60,6 +60,16 @@ class RedisHelper:
             logger.error(f"Error in RedisHelper.redis_set: {e}")
             return False
 
+    @staticmethod
+    async def redis_set_nx(key: str, value: Dict[str, Any], expiry: int) -> Optional[bool]:
+        """Set key only if it does not exist. Returns None when Redis is unavailable."""
+        try:
+            redis_client = await get_redis_client()
+            return bool(await redis_client.set(key, json.dumps(value), ex=expiry, nx=True))
+        except Exception as e:
+            logger.error(f"Error in RedisHelper.redis_set_nx for key {key}: {e}")
+            return None
+
     @staticmethod
     async def redis_get(key: str) -> Optional[Dict[str, Any]]:
         try:
@@ -0,0 +1,34 @@
+from functools import lru_cache
+from typing import Any, Dict, Optional
+
+from fastapi import Response, status
+from pydantic import TypeAdapter
+
+
+@lru_cache(maxsize=None)
+def _adapter(schema) -> TypeAdapter:
+    return TypeAdapter(schema)
+
+
+def dump_typed(schema, content: Any) -> bytes:
+    """Validate and serialize a payload against a response schema in pydantic-core."""
+    adapter = _adapter(schema)
+    return adapter.dump_json(adapter.validate_python(content, from_attributes=True))
+
+
+def json_response(
+        body,
+        status_code: int = status.HTTP_200_OK,
+        headers: Optional[Dict[str, str]] = None
+) -> Response:
+    """Return an already-serialized JSON body as is."""
+    return Response(content=body, status_code=status_code, headers=headers, media_type="application/json")
+
+
+def typed_response(
+        schema,
+        content: Any,
+        status_code: int = status.HTTP_200_OK,
+        headers: Optional[Dict[str, str]] = None
+) -> Response:
+    return json_response(dump_typed(schema, content), status_code=status_code, headers=headers)
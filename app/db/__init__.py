@@ -1,4 +1,4 @@
-from .models import User, Category, AnalyticsData, JournalEntryCategory, JournalEntryTag, JournalEntry, Mood, SentimentScore, TimeOfDay, Password, UserPreferences, Session, UserRole, Tag
+from .models import User, Category, AnalyticsData, JournalEntryCategory, JournalEntryTag, JournalEntry, Mood, SentimentScore, TimeOfDay, Password, UserPreferences, Session, UserRole, Tag, OutboxMessage, UserDailyStats
 from .session import engine, AsyncSessionLocal
 from .base import Base
 
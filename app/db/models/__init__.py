@@ -11,4 +11,6 @@ from .entry_analytics import AnalyticsData
 from .session import Session
 from .sentiment import SentimentScore
 from .password import Password
-from .tag import Tag
\ No newline at end of file
+from .tag import Tag
+from .outbox import OutboxMessage
+from .user_daily_stats import UserDailyStats
\ No newline at end of file
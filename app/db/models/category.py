@@ -1,6 +1,6 @@
 import uuid
 
-from sqlalchemy import Column, String, ForeignKey, UniqueConstraint
+from sqlalchemy import Column, String, ForeignKey, UniqueConstraint, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.dialects.postgresql import UUID
 
@@ -19,6 +19,8 @@ class Category(Base):
 
     __table_args__ = (
         UniqueConstraint('name', 'user_id', name='uix_name_user_id'),
+        Index('ix_categories_user_id_name_id', 'user_id', 'name', 'id'),
+        Index('ix_categories_user_id_name_trgm', 'user_id', 'name', postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'}),
     )
 
     def __repr__(self):
@@ -1,9 +1,9 @@
 import uuid
 import pendulum
 
-from sqlalchemy import Column, String, Integer, Float, DateTime, ForeignKey, Enum
+from sqlalchemy import Column, String, Integer, Float, DateTime, ForeignKey, Enum, Index
 from sqlalchemy.orm import relationship
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.dialects.postgresql import JSON, UUID
 
 from app.db.base import Base
 
@@ -25,5 +25,12 @@ class AnalyticsData(Base):
     created_at = Column(DateTime(timezone=True), default=lambda: pendulum.now("UTC"), nullable=False)
     updated_at = Column(DateTime(timezone=True), default=lambda: pendulum.now("UTC"), nullable=False)
     time_of_day = Column(Enum(TimeOfDay), default=TimeOfDay.MORNING)
+    content_hash = Column(String(64), nullable=True)
+    analysis_version = Column(String, nullable=True)
+    analysis = Column(JSON, nullable=True)
 
     journal_entry = relationship("JournalEntry", back_populates="analytics")
+
+    __table_args__ = (
+        Index('ix_analytics_data_content_hash', 'content_hash', 'analysis_version'),
+    )
@@ -1,9 +1,9 @@
 import uuid
 import pendulum
 
-from sqlalchemy import Column, String, DateTime, ForeignKey
-from sqlalchemy.orm import relationship
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Column, String, DateTime, ForeignKey, Index, Computed
+from sqlalchemy.orm import relationship, deferred
+from sqlalchemy.dialects.postgresql import UUID, TSVECTOR
 
 from app.db.base import Base
 
@@ -12,21 +12,36 @@ class JournalEntry(Base):
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     title = Column(String, nullable=True)
-    content = Column(String, nullable=False)
+    content = deferred(Column(String, nullable=False))
     summary = Column(String, nullable=True)
+    content_hash = Column(String(64), nullable=True)
     entry_date = Column(DateTime(timezone=True), default=lambda: pendulum.now("UTC"), nullable=False)
     created_at = Column(DateTime(timezone=True), default=lambda: pendulum.now("UTC"), nullable=False)
     updated_at = Column(DateTime(timezone=True), default=lambda: pendulum.now("UTC"), nullable=False)
     user_id = Column(UUID(as_uuid=True), ForeignKey('users.id'), nullable=True)
+    search_vector = deferred(Column(
+        TSVECTOR,
+        Computed(
+            "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+            "setweight(to_tsvector('english', coalesce(summary, '')), 'B') || "
+            "setweight(to_tsvector('english', content), 'C')",
+            persisted=True,
+        ),
+    ))
 
     # Relationships
     user = relationship('User', back_populates='journal_entries', single_parent=True, cascade="all, delete-orphan")
-    journal_entry_tags = relationship("JournalEntryTag", back_populates="journal_entry", cascade="all, delete-orphan")
+    journal_entry_tags = relationship("JournalEntryTag", back_populates="journal_entry", cascade="all, delete-orphan", passive_deletes=True)
     tags = relationship("Tag", secondary="journal_entry_tags", viewonly=True)
-    journal_entry_categories = relationship("JournalEntryCategory", back_populates="journal_entry", cascade="all, delete-orphan")
+    journal_entry_categories = relationship("JournalEntryCategory", back_populates="journal_entry", cascade="all, delete-orphan", passive_deletes=True)
     categories = relationship("Category", secondary="journal_entry_categories", viewonly=True)
-    sentiment = relationship('SentimentScore', back_populates='journal_entry', uselist=False, cascade="all, delete-orphan")
-    analytics = relationship('AnalyticsData', back_populates='journal_entry', uselist=False, cascade="all, delete-orphan")
+    sentiment = relationship('SentimentScore', back_populates='journal_entry', uselist=False, cascade="all, delete-orphan", passive_deletes=True)
+    analytics = relationship('AnalyticsData', back_populates='journal_entry', uselist=False, cascade="all, delete-orphan", passive_deletes=True)
+
+    __table_args__ = (
+        Index('ix_journal_entries_user_id_entry_date_id', 'user_id', 'entry_date', 'id'),
+        Index('ix_journal_entries_search_vector', 'search_vector', postgresql_using='gin'),
+    )
 
     def to_dict(self):
         return {
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, ForeignKey
+from sqlalchemy import Column, String, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.dialects.postgresql import UUID
 
@@ -7,9 +7,13 @@ from app.db.base import Base
 class JournalEntryCategory(Base):
     __tablename__ = 'journal_entry_categories'
 
-    journal_entry_id = Column(UUID(as_uuid=True), ForeignKey('journal_entries.id'), primary_key=True)
+    journal_entry_id = Column(UUID(as_uuid=True), ForeignKey('journal_entries.id', ondelete="CASCADE"), primary_key=True)
     category_id = Column(UUID(as_uuid=True), ForeignKey('categories.id'), primary_key=True)
 
     # Relationships
     journal_entry = relationship('JournalEntry', back_populates='journal_entry_categories')
     category = relationship('Category', back_populates='journal_entries')
+
+    __table_args__ = (
+        Index('ix_journal_entry_categories_category_id_journal_entry_id', 'category_id', 'journal_entry_id'),
+    )
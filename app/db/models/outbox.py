@@ -0,0 +1,24 @@
+import uuid
+import pendulum
+
+from sqlalchemy import Column, String, Integer, DateTime, Index
+from sqlalchemy.dialects.postgresql import JSON, UUID
+
+from app.db.base import Base
+
+class OutboxMessage(Base):
+    __tablename__ = 'outbox_messages'
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    exchange = Column(String, nullable=False, default="")
+    queue_name = Column(String, nullable=False)
+    payload = Column(JSON, nullable=False)
+    attempts = Column(Integer, nullable=False, default=0)
+    created_at = Column(DateTime(timezone=True), default=lambda: pendulum.now("UTC"), nullable=False)
+
+    __table_args__ = (
+        Index('ix_outbox_messages_created_at', 'created_at'),
+    )
+
+    def __repr__(self):
+        return f"<OutboxMessage(id={self.id}, queue_name={self.queue_name}, attempts={self.attempts})>"
@@ -1,7 +1,7 @@
 import uuid
 import pendulum
 
-from sqlalchemy import Column, String, Float, DateTime, ForeignKey, Enum
+from sqlalchemy import Column, String, Float, DateTime, ForeignKey, Enum, Index
 from sqlalchemy.dialects.postgresql import JSON, UUID
 from sqlalchemy.orm import relationship
 
@@ -13,16 +13,23 @@ class SentimentScore(Base):
     __tablename__ = 'sentiment_scores'
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    journal_id = Column(UUID(as_uuid=True), ForeignKey('journal_entries.id'), unique=True, nullable=False)
+    journal_id = Column(UUID(as_uuid=True), ForeignKey('journal_entries.id', ondelete="CASCADE"), unique=True, nullable=False)
     score = Column(Float, nullable=False)
     magnitude = Column(Float, nullable=False)
     mood = Column(Enum(Mood), default=Mood.NEUTRAL)
     calculation = Column(JSON, nullable=False)
     positive_words = Column(String, nullable=False)
     negative_words = Column(String, nullable=False)
+    content_hash = Column(String(64), nullable=True)
+    analysis_version = Column(String, nullable=True)
     created_at = Column(DateTime(timezone=True), default=lambda: pendulum.now("UTC"), nullable=False)
 
     journal_entry = relationship('JournalEntry', back_populates='sentiment', uselist=False)
 
+    __table_args__ = (
+        # Covers the user's entries -> date range -> score/mood path of the extremes lookup
+        Index('ix_sentiment_scores_journal_id_created_at', 'journal_id', 'created_at', postgresql_include=['score', 'mood']),
+    )
+
     def __repr__(self):
         return f"<SentimentScore(id={self.id}, journal_id={self.journal_id}, score={self.score})>"
@@ -1,6 +1,6 @@
 import uuid
 
-from sqlalchemy import Column, String, ForeignKey
+from sqlalchemy import Column, String, ForeignKey, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from sqlalchemy.schema import UniqueConstraint
@@ -19,6 +19,8 @@ class Tag(Base):
 
     __table_args__ = (
         UniqueConstraint('name', 'user_id', name='uq_tag_name_user_id'),
+        Index('ix_tags_user_id_name_id', 'user_id', 'name', 'id'),
+        Index('ix_tags_user_id_name_trgm', 'user_id', 'name', postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'}),
     )
 
     def __repr__(self):
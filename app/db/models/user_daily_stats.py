@@ -0,0 +1,31 @@
+import pendulum
+
+from sqlalchemy import Column, Integer, Float, Date, DateTime, ForeignKey, Enum
+from sqlalchemy.dialects.postgresql import UUID
+
+from app.db.base import Base
+from app.db.models.mood import Mood
+
+
+class UserDailyStats(Base):
+    """Per-user, per-UTC-day rollup of analytics_data and sentiment_scores."""
+    __tablename__ = 'user_daily_stats'
+
+    user_id = Column(UUID(as_uuid=True), ForeignKey('users.id', ondelete="CASCADE"), primary_key=True)
+    day = Column(Date, primary_key=True)
+    entries = Column(Integer, nullable=False, default=0)
+    words = Column(Integer, nullable=False, default=0)
+    characters = Column(Integer, nullable=False, default=0)
+    morning_entries = Column(Integer, nullable=False, default=0)
+    afternoon_entries = Column(Integer, nullable=False, default=0)
+    evening_entries = Column(Integer, nullable=False, default=0)
+    sentiment_count = Column(Integer, nullable=False, default=0)
+    sentiment_sum = Column(Float, nullable=False, default=0)
+    sentiment_min = Column(Float, nullable=True)
+    sentiment_max = Column(Float, nullable=True)
+    sentiment_min_mood = Column(Enum(Mood), nullable=True)
+    sentiment_max_mood = Column(Enum(Mood), nullable=True)
+    updated_at = Column(DateTime(timezone=True), default=lambda: pendulum.now("UTC"), nullable=False)
+
+    def __repr__(self):
+        return f"<UserDailyStats(user_id={self.user_id}, day={self.day}, entries={self.entries})>"
@@ -1,16 +1,18 @@
 import os
 from fastapi import FastAPI, APIRouter
+from fastapi.responses import ORJSONResponse
 import asyncio
 
 from app.configs.rate_limiter import limiter
 from app.configs.redis_config import get_redis_client
-from app.core.rabbitmq import RabbitMQ
 from fastapi.exceptions import RequestValidationError
 
 from app.core.error_handler import validation_exception_handler
 from app.core.logger import logger, configure_loguru
 from app.routes import users, auth, journal
 from app.services.journal_worker import rabbitmq_handler
+from app.services.outbox_relay import run_outbox_relay
+from app.services.queueing import rabbitmq
 from app.services.scheduler import start_cron_jobs
 from slowapi import  _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
@@ -20,7 +22,7 @@ from slowapi.middleware import SlowAPIMiddleware
 
 
 # Initialize FastAPI app
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
 
 
 
@@ -43,8 +45,6 @@ app.include_router(api_router)
 
 configure_loguru()
 
-rabbitmq = RabbitMQ("amqp://localhost")
-
 
 @app.on_event("startup")
 async def startup_event():
@@ -66,6 +66,9 @@ async def startup_event():
             rabbitmq.consume("entry_queue", rabbitmq_handler)
         )
 
+        # Drain the transactional outbox to RabbitMQ
+        asyncio.create_task(run_outbox_relay())
+
     except Exception as e:
         logger.error(f"Startup error: {e}")
 
@@ -1,26 +1,70 @@
-from fastapi import APIRouter, Depends, HTTPException, Request, Query
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, Query, Header, status
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
+from pydantic import ValidationError
+
+from typing import List, Optional
+from datetime import datetime
+from uuid import UUID
+
+import orjson
 
 from app.core.authenticator import authenticate_user, authorize
 from app.schemas.auth import  AuthenticatedUser
 
 from app.controllers import journal as journal
 from app.controllers import summary as summary
-from app.db.session import get_db
+from app.db.session import get_db, AsyncSessionLocal
+from app.core.responses import dump_typed, json_response, typed_response
+from app.services import response_cache
+from app.utils.functions import etag_matches
 
 
-from app.schemas.journal import CategorySchema, TagSchema, CreateJournalEntrySchema
+from app.db.models.mood import Mood
+from app.schemas.journal import (
+    CategorySchema, TagSchema, CreateJournalEntrySchema, BatchEntriesSchema, BatchGetEntriesSchema,
+    BatchRetagEntriesSchema, DraftSchema, EntryFilterSchema, CategoryPageSchema, TagPageSchema,
+    JournalEntryResponseSchema, BatchGetEntriesResponseSchema
+)
+from app.schemas.summary import JournalSummarySchema, SentimentExtremesSchema
 
 router = APIRouter(prefix="/journal", tags=["Journal"])
 
 
-@router.get("/list-categories")
+@router.get("/list-categories", response_model=CategoryPageSchema)
 async def get_categories(
+    user: AuthenticatedUser = Depends(authenticate_user),
+        _=Depends(authorize(["ADMIN", "USER"])),
+    page: int = Query(1, ge=1),
+    limit: int = Query(10, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="Opaque keyset cursor; pass an empty value for the first page.")
+):
+    # Cache hits are served without opening a database session
+    cache_key, cached = await response_cache.lookup(str(user.user_id), "list-categories", page, limit, cursor)
+    if cached is not None:
+        return json_response(cached["body"])
+
+    async with AsyncSessionLocal() as db:
+        result, code = await journal.get_categories(db=db, user_id=user.user_id, page=page, limit=limit, cursor=cursor)
+
+        if "error" in result:
+            raise HTTPException(status_code=code, detail=result["error"])
+        cached = {"body": dump_typed(CategoryPageSchema, result).decode()}
+
+    await response_cache.store(cache_key, cached)
+    return json_response(cached["body"])
+
+
+@router.get("/autocomplete-categories")
+async def autocomplete_categories(
+    q: str = Query(..., min_length=1, max_length=100),
+    limit: int = Query(10, ge=1, le=50),
     user: AuthenticatedUser = Depends(authenticate_user),
         _=Depends(authorize(["ADMIN", "USER"])),
     db: AsyncSession = Depends(get_db)
 ):
-    result, code = await journal.get_categories(db=db, user_id=user.user_id)
+    result, code = await journal.autocomplete_categories(db=db, user_id=str(user.user_id), query=q, limit=limit)
 
     if "error" in result:
         raise HTTPException(status_code=code, detail=result["error"])
@@ -60,13 +104,39 @@ async def delete_category(categoryId: str,  user: AuthenticatedUser = Depends(au
     return result
 
 
-@router.get("/list-tags")
+@router.get("/list-tags", response_model=TagPageSchema)
 async def get_tags(
+    user: AuthenticatedUser = Depends(authenticate_user),
+        _=Depends(authorize(["ADMIN", "USER"])),
+    page: int = Query(1, ge=1),
+    limit: int = Query(10, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="Opaque keyset cursor; pass an empty value for the first page.")
+):
+    # Cache hits are served without opening a database session
+    cache_key, cached = await response_cache.lookup(str(user.user_id), "list-tags", page, limit, cursor)
+    if cached is not None:
+        return json_response(cached["body"])
+
+    async with AsyncSessionLocal() as db:
+        result, code = await journal.get_tags(db=db, user_id=user.user_id, page=page, limit=limit, cursor=cursor)
+
+        if "error" in result:
+            raise HTTPException(status_code=code, detail=result["error"])
+        cached = {"body": dump_typed(TagPageSchema, result).decode()}
+
+    await response_cache.store(cache_key, cached)
+    return json_response(cached["body"])
+
+
+@router.get("/autocomplete-tags")
+async def autocomplete_tags(
+    q: str = Query(..., min_length=1, max_length=100),
+    limit: int = Query(10, ge=1, le=50),
     user: AuthenticatedUser = Depends(authenticate_user),
         _=Depends(authorize(["ADMIN", "USER"])),
     db: AsyncSession = Depends(get_db)
 ):
-    result, code = await journal.get_tags(db=db, user_id=user.user_id)
+    result, code = await journal.autocomplete_tags(db=db, user_id=str(user.user_id), query=q, limit=limit)
 
     if "error" in result:
         raise HTTPException(status_code=code, detail=result["error"])
@@ -110,13 +180,15 @@ async def create_entry(
         request: CreateJournalEntrySchema,
         user: AuthenticatedUser = Depends(authenticate_user),
         _: None = Depends(authorize(["ADMIN", "USER"])),
-        db: AsyncSession = Depends(get_db)
+        db: AsyncSession = Depends(get_db),
+        idempotency_key: Optional[str] = Header(None, alias="Idempotency-Key", max_length=255)
 ):
 
         result, code = await journal.create_journal_entry(
             db=db,
             parsed_data=request,
-            user_id=str(user.user_id)
+            user_id=str(user.user_id),
+            idempotency_key=idempotency_key
         )
 
         if "error" in result:
@@ -124,6 +196,52 @@ async def create_entry(
         return result
 
 
+@router.post("/import")
+async def import_entries(
+        request: Request,
+        user: AuthenticatedUser = Depends(authenticate_user),
+        _: None = Depends(authorize(["ADMIN", "USER"])),
+):
+        # Receive the whole upload before the response starts streaming
+        upload = await journal.spool_upload(request.stream())
+
+        # The import outlives the request-scoped session, so it opens its own
+        async def progress():
+            async with AsyncSessionLocal() as db:
+                async for line in journal.import_journal_entries(
+                    db=db,
+                    stream=journal.read_spooled(upload),
+                    user_id=str(user.user_id)
+                ):
+                    yield line
+
+        return StreamingResponse(progress(), media_type="application/x-ndjson")
+
+
+@router.get("/export")
+async def export_entries(
+        format: str = Query("ndjson", pattern="^(ndjson|csv)$"),
+        user: AuthenticatedUser = Depends(authenticate_user),
+        _: None = Depends(authorize(["ADMIN", "USER"])),
+):
+        # Like the import, the export outlives the request-scoped session
+        async def rows():
+            async with AsyncSessionLocal() as db:
+                async for chunk in journal.export_journal_entries(
+                    db=db,
+                    user_id=str(user.user_id),
+                    format=format
+                ):
+                    yield chunk
+
+        media_type = "text/csv" if format == "csv" else "application/x-ndjson"
+        return StreamingResponse(
+            rows(),
+            media_type=media_type,
+            headers={"Content-Disposition": f'attachment; filename="journal-export.{format}"'}
+        )
+
+
 @router.put("/update-entry/{entryId}")
 async def update_entry(
         entryId: str,
@@ -145,6 +263,62 @@ async def update_entry(
             raise HTTPException(status_code=code, detail=result["error"])
         return result
 
+@router.put("/autosave-draft/{entryId}")
+async def autosave_draft(
+        entryId: UUID,
+        request: DraftSchema,
+        user: AuthenticatedUser = Depends(authenticate_user),
+        _: None = Depends(authorize(["ADMIN", "USER"])),
+        db: AsyncSession = Depends(get_db)
+):
+
+        result, code = await journal.autosave_draft(
+            db=db,
+            draft_data=request,
+            user_id=str(user.user_id),
+            journal_id=str(entryId)
+        )
+
+        if "error" in result:
+            raise HTTPException(status_code=code, detail=result["error"])
+        return result
+
+
+@router.get("/draft/{entryId}")
+async def view_draft(
+        entryId: UUID,
+        user: AuthenticatedUser = Depends(authenticate_user),
+        _: None = Depends(authorize(["ADMIN", "USER"])),
+):
+
+        result, code = await journal.get_draft(
+            user_id=str(user.user_id),
+            journal_id=str(entryId)
+        )
+
+        if "error" in result:
+            raise HTTPException(status_code=code, detail=result["error"])
+        return result
+
+
+@router.post("/save-draft/{entryId}")
+async def save_draft(
+        entryId: UUID,
+        user: AuthenticatedUser = Depends(authenticate_user),
+        _: None = Depends(authorize(["ADMIN", "USER"])),
+        db: AsyncSession = Depends(get_db)
+):
+
+        result, code = await journal.save_draft(
+            db=db,
+            user_id=str(user.user_id),
+            journal_id=str(entryId)
+        )
+
+        if "error" in result:
+            raise HTTPException(status_code=code, detail=result["error"])
+        return result
+
 @router.delete("/delete-entry/{entryId}")
 async def delete_entry(
         entryId: str,
@@ -164,77 +338,226 @@ async def delete_entry(
         return result
 
 
+@router.post("/batch-delete-entries")
+async def batch_delete_entries(
+        request: BatchEntriesSchema,
+        user: AuthenticatedUser = Depends(authenticate_user),
+        _: None = Depends(authorize(["ADMIN", "USER"])),
+        db: AsyncSession = Depends(get_db)
+):
+
+        result, code = await journal.batch_delete_journal_entries(
+            db=db,
+            data=request,
+            user_id=str(user.user_id)
+        )
+
+        if "error" in result:
+            raise HTTPException(status_code=code, detail=result["error"])
+        return result
+
+
+@router.post("/batch-update-entries")
+async def batch_update_entries(
+        request: BatchRetagEntriesSchema,
+        user: AuthenticatedUser = Depends(authenticate_user),
+        _: None = Depends(authorize(["ADMIN", "USER"])),
+        db: AsyncSession = Depends(get_db)
+):
+
+        result, code = await journal.batch_retag_journal_entries(
+            db=db,
+            data=request,
+            user_id=str(user.user_id)
+        )
+
+        if "error" in result:
+            raise HTTPException(status_code=code, detail=result["error"])
+        return result
+
+
+def entry_filters(
+    start_date: Optional[datetime] = Query(None),
+    end_date: Optional[datetime] = Query(None),
+    tag_ids: Optional[List[UUID]] = Query(None),
+    category_ids: Optional[List[UUID]] = Query(None),
+    moods: Optional[List[Mood]] = Query(None),
+    min_score: Optional[float] = Query(None),
+    max_score: Optional[float] = Query(None),
+) -> EntryFilterSchema:
+    try:
+        return EntryFilterSchema(
+            start_date=start_date,
+            end_date=end_date,
+            tag_ids=tag_ids,
+            category_ids=category_ids,
+            moods=moods,
+            min_score=min_score,
+            max_score=max_score,
+        )
+    except ValidationError as e:
+        raise RequestValidationError(e.errors())
+
+
 @router.get("/list-entries")
 async def get_journal_entries(
     user: AuthenticatedUser = Depends(authenticate_user),
     _=Depends(authorize(["ADMIN", "USER"])),
-    db: AsyncSession = Depends(get_db),
     page: int = Query(1, ge=1),  # Default to page 1, with a minimum of 1
-    limit: int = Query(10, le=100)  # Default to 10 entries per page, with a max of 100
+    limit: int = Query(10, ge=1, le=100),  # Default to 10 entries per page, with a max of 100
+    cursor: Optional[str] = Query(None, description="Opaque keyset cursor; pass an empty value for the first page."),
+    filters: EntryFilterSchema = Depends(entry_filters),
+    fields: Optional[str] = Query(None, description="Comma-separated subset of id, user_id, entry_date, title, summary, excerpt, categories, tags."),
+    if_none_match: Optional[str] = Header(None, alias="If-None-Match")
 ):
-    # Call the updated function to get journal entries, passing in pagination params
-    result, code = await journal.get_journal_entries(db=db, user_id=str(user.user_id), page=page, limit=limit)
+    user_id = str(user.user_id)
+    fields = [field.strip() for field in fields.split(",") if field.strip()] if fields else None
 
-    # Check if there's an error in the result and raise an HTTPException
-    if "error" in result:
-        raise HTTPException(status_code=code, detail=result["error"])
+    # Cache hits carry their ETag, so neither a hit nor a 304 opens a database session
+    cache_key, cached = await response_cache.lookup(
+        user_id, "list-entries", page, limit, cursor, fields, filters.model_dump_json()
+    )
+    if cached is None:
+        async with AsyncSessionLocal() as db:
+            # Answer polling clients from the version columns alone when nothing on the page changed
+            etag = await journal.get_journal_entries_etag(db=db, user_id=user_id, page=page, limit=limit, cursor=cursor, fields=fields, filters=filters)
+            if etag_matches(if_none_match, etag):
+                return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+            # Call the updated function to get journal entries, passing in pagination params
+            result, code = await journal.get_journal_entries(db=db, user_id=user_id, page=page, limit=limit, cursor=cursor, fields=fields, filters=filters)
+
+        # Check if there's an error in the result and raise an HTTPException
+        if "error" in result:
+            raise HTTPException(status_code=code, detail=result["error"])
+
+        cached = {"etag": etag, "body": orjson.dumps(result).decode()}
+        await response_cache.store(cache_key, cached)
+    elif etag_matches(if_none_match, cached["etag"]):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": cached["etag"]})
 
     # Return the journal entries result
-    return result
+    return json_response(cached["body"], headers={"ETag": cached["etag"]})
 
-@router.get("/view-entry/{entryId}")
+@router.get("/view-entry/{entryId}", response_model=List[JournalEntryResponseSchema])
 async def view_entry(
         entryId: str,
         user: AuthenticatedUser = Depends(authenticate_user),
         _: None = Depends(authorize(["ADMIN", "USER"])),
+        if_none_match: Optional[str] = Header(None, alias="If-None-Match")
+):
+        user_id = str(user.user_id)
+
+        cache_key, cached = await response_cache.lookup(user_id, "view-entry", entryId)
+        if cached is None:
+            async with AsyncSessionLocal() as db:
+                etag = await journal.get_journal_entry_etag(db=db, user_id=user_id, journal_id=entryId)
+                if etag_matches(if_none_match, etag):
+                    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+                result, code = await journal.get_journal_entry(
+                    db=db,
+                    user_id=user_id,
+                    journal_id=entryId
+                )
+
+                if "error" in result:
+                    raise HTTPException(status_code=code, detail=result["error"])
+                cached = {"etag": etag, "body": dump_typed(List[JournalEntryResponseSchema], result).decode()}
+
+            await response_cache.store(cache_key, cached)
+        elif etag_matches(if_none_match, cached["etag"]):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": cached["etag"]})
+
+        return json_response(cached["body"], headers={"ETag": cached["etag"]})
+
+@router.post("/entries:batchGet", response_model=BatchGetEntriesResponseSchema)
+async def batch_get_entries(
+        request: BatchGetEntriesSchema,
+        user: AuthenticatedUser = Depends(authenticate_user),
+        _: None = Depends(authorize(["ADMIN", "USER"])),
         db: AsyncSession = Depends(get_db)
 ):
 
-        result, code = await journal.get_journal_entry(
+        result, code = await journal.batch_get_journal_entries(
             db=db,
-            user_id=str(user.user_id),
-            journal_id=entryId
+            data=request,
+            user_id=str(user.user_id)
         )
 
         if "error" in result:
             raise HTTPException(status_code=code, detail=result["error"])
-        return result
+        return typed_response(BatchGetEntriesResponseSchema, result)
+
+@router.get("/search")
+async def search_entries(
+    q: str = Query(..., min_length=1, max_length=256),
+    page: int = Query(1, ge=1),
+    limit: int = Query(10, ge=1, le=100),
+    tag_ids: Optional[List[UUID]] = Query(None),
+    category_ids: Optional[List[UUID]] = Query(None),
+    start_date: Optional[datetime] = Query(None),
+    end_date: Optional[datetime] = Query(None),
+    user: AuthenticatedUser = Depends(authenticate_user),
+    _: None = Depends(authorize(["ADMIN", "USER"])),
+    db: AsyncSession = Depends(get_db),
+):
+    result, code = await journal.search_journal_entries(
+        db=db,
+        user_id=str(user.user_id),
+        query=q,
+        page=page,
+        limit=limit,
+        tag_ids=tag_ids,
+        category_ids=category_ids,
+        start_date=start_date,
+        end_date=end_date
+    )
+
+    if "error" in result:
+        raise HTTPException(status_code=code, detail=result["error"])
+    return result
 
-@router.get("/summary")
+@router.get("/summary", response_model=JournalSummarySchema)
 async def journal_summary(
     start_date: str = Query(None),
     end_date: str = Query(None),
     user: AuthenticatedUser = Depends(authenticate_user),
     _: None = Depends(authorize(["ADMIN", "USER"])),
-    db: AsyncSession = Depends(get_db),
 ):
+    # Opens its own sessions, one per concurrent read
     result, code = await summary.get_journal_summary(
         user_id=str(user.user_id),
-        db=db,
         start=start_date,
         end=end_date
     )
 
     if "error" in result:
         raise HTTPException(status_code=code, detail=result["error"])
-    return result
+    if code != status.HTTP_200_OK:
+        # The no-data message is not the response_model; bypass its validation but keep the 200
+        return ORJSONResponse(result)
+    return typed_response(JournalSummarySchema, result)
 
 
-@router.get("/sentiment-extremes")
+@router.get("/sentiment-extremes", response_model=SentimentExtremesSchema)
 async def sentiment_extremes(
     start_date: str = Query(None),
     end_date: str = Query(None),
     user: AuthenticatedUser = Depends(authenticate_user),
     _: None = Depends(authorize(["ADMIN", "USER"])),
-    db: AsyncSession = Depends(get_db),
+    k: int = Query(1, ge=1, le=50, description="Number of entries to return at each extreme."),
 ):
     result, code = await summary.get_sentiment_extremes(
         user_id=str(user.user_id),
-        db=db,
         start_date=start_date,
-        end_date=end_date
+        end_date=end_date,
+        k=k
     )
 
     if "error" in result:
         raise HTTPException(status_code=code, detail=result["error"])
-    return result
\ No newline at end of file
+    if code != status.HTTP_200_OK:
+        # The no-data message is not the response_model; bypass its validation but keep the 200
+        return ORJSONResponse(result)
+    return typed_response(SentimentExtremesSchema, result)
\ No newline at end of file
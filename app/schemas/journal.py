@@ -1,6 +1,9 @@
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, field_validator, model_validator
 from typing import List, Optional
-from datetime import date
+from datetime import date, datetime
+from uuid import UUID
+
+from app.db.models.mood import Mood
 
 def capitalize_field_value(value: str) -> str:
     return value.upper() if value else value
@@ -36,4 +39,124 @@ class CreateJournalEntrySchema(BaseModel):
 
     class Config:
         str_min_length = 1
-        str_strip_whitespace = True
\ No newline at end of file
+        str_strip_whitespace = True
+
+
+class DraftSchema(BaseModel):
+    title: Optional[str] = Field(None, min_length=3, max_length=255, description="Title must be at least 3 characters long and at most 255 characters.")
+    content: str = Field(..., min_length=10, description="Content must be at least 10 characters long.")
+
+    class Config:
+        str_strip_whitespace = True
+
+
+class ImportJournalEntrySchema(CreateJournalEntrySchema):
+    entry_date: datetime = Field(default_factory=datetime.now, alias="entryDate", description="Original entry timestamp, defaults to now.")
+
+    class Config:
+        str_min_length = 1
+        str_strip_whitespace = True
+        validate_by_name = True
+
+
+
+class EntryFilterSchema(BaseModel):
+    start_date: Optional[datetime] = Field(None, alias="startDate")
+    end_date: Optional[datetime] = Field(None, alias="endDate")
+    tag_ids: Optional[List[UUID]] = Field(None, alias="tagIds")
+    category_ids: Optional[List[UUID]] = Field(None, alias="categoryIds")
+    moods: Optional[List[Mood]] = Field(None, alias="moods")
+    min_score: Optional[float] = Field(None, alias="minScore")
+    max_score: Optional[float] = Field(None, alias="maxScore")
+
+    @model_validator(mode="after")
+    def check_score_range(self):
+        if self.min_score is not None and self.max_score is not None and self.min_score > self.max_score:
+            raise ValueError("minScore must not be greater than maxScore")
+        return self
+
+    def has_criteria(self) -> bool:
+        # Empty lists add no condition, same as missing ones
+        return any(value not in (None, []) for value in self.model_dump().values())
+
+    class Config:
+        validate_by_name = True
+
+
+class BatchEntriesSchema(BaseModel):
+    entry_ids: Optional[List[UUID]] = Field(None, alias="entryIds", max_length=1000, description="Entries to act on.")
+    filter: Optional[EntryFilterSchema] = Field(None, description="Select entries by filter instead of ids.")
+
+    @model_validator(mode="after")
+    def require_target(self):
+        if not self.entry_ids and not self.filter:
+            raise ValueError("Either entryIds or filter is required")
+        # An empty filter would select every entry the user has
+        if not self.entry_ids and not self.filter.has_criteria():
+            raise ValueError("filter must set at least one criterion")
+        return self
+
+    class Config:
+        validate_by_name = True
+
+
+class BatchGetEntriesSchema(BaseModel):
+    entry_ids: List[UUID] = Field(..., alias="entryIds", min_length=1, max_length=500, description="Entries to fetch.")
+
+    class Config:
+        validate_by_name = True
+
+
+class BatchRetagEntriesSchema(BatchEntriesSchema):
+    add_tags: List[str] = Field([], alias="addTags", description="Tags to add to every selected entry.")
+    remove_tags: List[str] = Field([], alias="removeTags", description="Tags to remove from every selected entry.")
+    set_categories: Optional[List[str]] = Field(None, alias="setCategories", description="Replace the categories of every selected entry.")
+
+
+class TagResponseSchema(BaseModel):
+    id: UUID
+    name: str
+    user_id: Optional[UUID] = None
+
+    class Config:
+        from_attributes = True
+
+
+class CategoryResponseSchema(BaseModel):
+    id: UUID
+    name: str
+    user_id: Optional[UUID] = None
+
+    class Config:
+        from_attributes = True
+
+
+class TagPageSchema(BaseModel):
+    tags: List[TagResponseSchema]
+    nextCursor: Optional[str] = None
+
+
+class CategoryPageSchema(BaseModel):
+    categories: List[CategoryResponseSchema]
+    nextCursor: Optional[str] = None
+
+
+class JournalEntryResponseSchema(BaseModel):
+    id: UUID
+    title: Optional[str] = None
+    content: str
+    summary: Optional[str] = None
+    entry_date: datetime
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+    user_id: Optional[UUID] = None
+    tags: List[TagResponseSchema] = []
+    categories: List[CategoryResponseSchema] = []
+
+    class Config:
+        from_attributes = True
+
+
+class BatchGetEntriesResponseSchema(BaseModel):
+    entries: List[JournalEntryResponseSchema]
+    missing: List[UUID]
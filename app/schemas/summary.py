@@ -0,0 +1,69 @@
+from pydantic import BaseModel
+from typing import Dict, List, Optional, Union
+from uuid import UUID
+
+from app.db.models.mood import Mood
+from app.db.models.time_of_day import TimeOfDay
+
+
+class WordCountTrendSchema(BaseModel):
+    date: str
+    wordCount: int
+
+
+class CategoryDistributionSchema(BaseModel):
+    categoryId: UUID
+    categoryName: str
+    count: int
+
+
+class MoodTrendSchema(BaseModel):
+    date: str
+    mood: Optional[Mood] = None
+    score: float
+
+
+class HeatmapPointSchema(BaseModel):
+    date: str
+    count: int
+
+
+class MoodSummarySchema(BaseModel):
+    total_score: float
+    # +/-inf when there is no sentiment data; serialized as null
+    max_score: float
+    min_score: float
+    max_mood: Optional[Union[Mood, str]] = None
+    min_mood: Optional[Union[Mood, str]] = None
+
+
+class JournalSummarySchema(BaseModel):
+    total_entries: int
+    avg_word_count: float
+    most_used_category: str
+    word_count_trends: List[WordCountTrendSchema]
+    category_distribution: List[CategoryDistributionSchema]
+    time_of_day_analysis: Dict[TimeOfDay, int]
+    mood_trends: List[MoodTrendSchema]
+    overall_mood_per_day: Dict[str, Mood]
+    total_entries_per_year: Dict[int, int]
+    total_entries_per_week: Dict[int, int]
+    total_words_per_year: Dict[int, int]
+    total_words_per_week: Dict[int, int]
+    distinct_days_journaled: int
+    heatmap_data: List[HeatmapPointSchema]
+    mood_summary: MoodSummarySchema
+
+
+class SentimentExtremeSchema(BaseModel):
+    journal_id: UUID
+    mood: Optional[Mood] = None
+    score: float
+    content: str
+
+
+class SentimentExtremesSchema(BaseModel):
+    most_positive: SentimentExtremeSchema
+    most_negative: SentimentExtremeSchema
+    top_positive: List[SentimentExtremeSchema]
+    top_negative: List[SentimentExtremeSchema]
@@ -0,0 +1,196 @@
+import argparse
+import asyncio
+
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Iterable, Optional, Set
+
+from sqlalchemy import and_, delete, func, literal_column
+from sqlalchemy.dialects.postgresql import aggregate_order_by, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+
+from app.core.logger import logger
+from app.db.models import AnalyticsData, JournalEntry, SentimentScore, TimeOfDay, UserDailyStats
+from app.db.session import AsyncSessionLocal
+
+# Day buckets are UTC calendar dates
+UTC = literal_column("'UTC'")
+
+TIME_OF_DAY_COLUMNS = {
+    TimeOfDay.MORNING: "morning_entries",
+    TimeOfDay.AFTERNOON: "afternoon_entries",
+    TimeOfDay.EVENING: "evening_entries",
+}
+
+ROLLUP_COLUMNS = [
+    "user_id", "day", "entries", "words", "characters",
+    *TIME_OF_DAY_COLUMNS.values(),
+    "sentiment_count", "sentiment_sum", "sentiment_min", "sentiment_max",
+    "sentiment_min_mood", "sentiment_max_mood", "updated_at",
+]
+
+
+def utc_day(column):
+    return func.date(func.timezone(UTC, column))
+
+
+def to_utc_day(value: datetime) -> date:
+    if value.tzinfo is None:
+        return value.date()
+    return value.astimezone(timezone.utc).date()
+
+
+def entry_stat_days():
+    """Timestamps that place an entry in the rollup."""
+    return (
+        select(AnalyticsData.entry_date)
+        .where(AnalyticsData.journal_id == JournalEntry.id)
+        .scalar_subquery().label("analytics_date"),
+        select(SentimentScore.created_at)
+        .where(SentimentScore.journal_id == JournalEntry.id)
+        .scalar_subquery().label("sentiment_date"),
+    )
+
+
+def days_of(rows) -> Set[date]:
+    return {
+        to_utc_day(value)
+        for row in rows
+        for value in (row.analytics_date, row.sentiment_date)
+        if value is not None
+    }
+
+
+def _rollup_select(user_id=None, days: Optional[Set[date]] = None):
+    analytics_day = utc_day(AnalyticsData.entry_date)
+    analytics = (
+        select(
+            JournalEntry.user_id.label("user_id"),
+            analytics_day.label("day"),
+            func.count().label("entries"),
+            func.sum(AnalyticsData.word_count).label("words"),
+            func.sum(AnalyticsData.character_count).label("characters"),
+            *(
+                func.count().filter(AnalyticsData.time_of_day == time_of_day).label(column)
+                for time_of_day, column in TIME_OF_DAY_COLUMNS.items()
+            ),
+        )
+        .join(JournalEntry, JournalEntry.id == AnalyticsData.journal_id)
+        .group_by(JournalEntry.user_id, analytics_day)
+    )
+
+    sentiment_day = utc_day(SentimentScore.created_at)
+    sentiment = (
+        select(
+            JournalEntry.user_id.label("user_id"),
+            sentiment_day.label("day"),
+            func.count().label("sentiment_count"),
+            func.sum(SentimentScore.score).label("sentiment_sum"),
+            func.min(SentimentScore.score).label("sentiment_min"),
+            func.max(SentimentScore.score).label("sentiment_max"),
+            func.array_agg(aggregate_order_by(SentimentScore.mood, SentimentScore.score.asc()))[1].label("sentiment_min_mood"),
+            func.array_agg(aggregate_order_by(SentimentScore.mood, SentimentScore.score.desc()))[1].label("sentiment_max_mood"),
+        )
+        .join(JournalEntry, JournalEntry.id == SentimentScore.journal_id)
+        .group_by(JournalEntry.user_id, sentiment_day)
+    )
+
+    if user_id is not None:
+        analytics = analytics.where(JournalEntry.user_id == user_id)
+        sentiment = sentiment.where(JournalEntry.user_id == user_id)
+    if days:
+        # The range keeps the scan on the date indexes; the IN list trims it to the touched days
+        start = datetime.combine(min(days), time.min, tzinfo=timezone.utc)
+        end = datetime.combine(max(days) + timedelta(days=1), time.min, tzinfo=timezone.utc)
+        analytics = analytics.where(
+            AnalyticsData.entry_date >= start, AnalyticsData.entry_date < end, analytics_day.in_(days)
+        )
+        sentiment = sentiment.where(
+            SentimentScore.created_at >= start, SentimentScore.created_at < end, sentiment_day.in_(days)
+        )
+
+    a = analytics.subquery()
+    s = sentiment.subquery()
+    return select(
+        func.coalesce(a.c.user_id, s.c.user_id),
+        func.coalesce(a.c.day, s.c.day),
+        func.coalesce(a.c.entries, 0),
+        func.coalesce(a.c.words, 0),
+        func.coalesce(a.c.characters, 0),
+        *(func.coalesce(a.c[column], 0) for column in TIME_OF_DAY_COLUMNS.values()),
+        func.coalesce(s.c.sentiment_count, 0),
+        func.coalesce(s.c.sentiment_sum, 0),
+        s.c.sentiment_min,
+        s.c.sentiment_max,
+        s.c.sentiment_min_mood,
+        s.c.sentiment_max_mood,
+        func.now(),
+    ).select_from(
+        a.join(s, and_(a.c.user_id == s.c.user_id, a.c.day == s.c.day), full=True)
+    )
+
+
+def _rollup_upsert(user_id=None, days: Optional[Set[date]] = None):
+    stmt = insert(UserDailyStats).from_select(ROLLUP_COLUMNS, _rollup_select(user_id, days))
+    return stmt.on_conflict_do_update(
+        index_elements=["user_id", "day"],
+        set_={column: stmt.excluded[column] for column in ROLLUP_COLUMNS if column not in ("user_id", "day")},
+    )
+
+
+async def refresh_days(db: AsyncSession, user_id, days: Iterable[date]):
+    """Recompute the user's rollup rows for the given days."""
+    days = set(days)
+    if not days:
+        return
+
+    # Concurrent workers rebuilding the same user-day would overwrite each other's rows
+    # from their own snapshots; the lock makes the later one recompute after the first commits
+    for day in sorted(days):
+        await db.execute(select(func.pg_advisory_xact_lock(func.hashtext(f"{user_id}:{day.isoformat()}"))))
+
+    await db.execute(
+        delete(UserDailyStats)
+        .where(UserDailyStats.user_id == user_id, UserDailyStats.day.in_(days))
+        .execution_options(synchronize_session=False)
+    )
+    await db.execute(_rollup_upsert(user_id, days))
+
+
+async def refresh_entry_days(db: AsyncSession, user_id, journal_id) -> Set[date]:
+    """Refresh the days an entry currently contributes to, after its analytics were written."""
+    result = await db.execute(
+        select(*entry_stat_days()).where(JournalEntry.id == journal_id)
+    )
+    days = days_of(result.all())
+    await refresh_days(db, user_id, days)
+    return days
+
+
+async def rebuild(db: AsyncSession, user_id=None):
+    """Recompute the rollup from analytics_data and sentiment_scores, for one user or everyone."""
+    stmt = delete(UserDailyStats)
+    if user_id is not None:
+        stmt = stmt.where(UserDailyStats.user_id == user_id)
+
+    await db.execute(stmt)
+    await db.execute(_rollup_upsert(user_id))
+    await db.commit()
+
+
+async def _rebuild_command(user_id: Optional[str]):
+    async with AsyncSessionLocal() as db:
+        await rebuild(db, user_id)
+    logger.info(f"Rebuilt user_daily_stats for {user_id or 'all users'}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rebuild the user_daily_stats rollup.")
+    parser.add_argument("--user-id", help="Only rebuild this user's rows.")
+    args = parser.parse_args()
+
+    asyncio.run(_rebuild_command(args.user_id))
+
+
+if __name__ == "__main__":
+    main()
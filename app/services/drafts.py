@@ -0,0 +1,178 @@
+import json
+import time
+
+from datetime import datetime
+from typing import Iterable, Optional
+
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+from sqlalchemy.orm import aliased
+
+from app.configs.redis_config import get_redis_client
+from app.core.logger import logger
+from app.core.redis_helper import RedisHelper
+from app.db.models import JournalEntry
+from app.db.session import AsyncSessionLocal
+from app.services import response_cache
+from app.services.outbox_relay import notify_outbox
+from app.services.queueing import publish_to_queue
+from app.utils.functions import content_hash
+
+# Config
+DRAFT_KEY_PREFIX = "draft"
+PENDING_DRAFTS_KEY = "drafts-pending"
+DRAFT_TTL_SECONDS = 7 * 24 * 60 * 60
+DRAFT_SETTLE_SECONDS = 30
+FLUSH_BATCH_SIZE = 100
+
+
+def draft_key(user_id: str, journal_id: str) -> str:
+    return RedisHelper._make_key(DRAFT_KEY_PREFIX, f"{user_id}-{journal_id}")
+
+
+def pending_member(user_id: str, journal_id: str) -> str:
+    return f"{user_id}:{journal_id}"
+
+
+async def save_draft(journal_id: str, user_id: str, title: Optional[str], content: str) -> dict:
+    """Write the latest draft to Redis and (re)schedule it for write-behind."""
+    saved_at = time.time()
+    draft = {
+        "id": journal_id,
+        "userId": user_id,
+        "title": title,
+        "content": content,
+        "savedAt": saved_at,
+    }
+
+    redis_client = await get_redis_client()
+    async with redis_client.pipeline(transaction=True) as pipe:
+        pipe.set(draft_key(user_id, journal_id), json.dumps(draft), ex=DRAFT_TTL_SECONDS)
+        pipe.zadd(PENDING_DRAFTS_KEY, {pending_member(user_id, journal_id): saved_at})
+        await pipe.execute()
+
+    return draft
+
+
+async def load_draft(journal_id: str, user_id: str) -> Optional[dict]:
+    draft = await RedisHelper.redis_get(draft_key(user_id, journal_id))
+    if not draft or draft.get("userId") != user_id:
+        return None
+    return draft
+
+
+async def discard_drafts(user_id: str, journal_ids: Iterable[str]):
+    """Drop pending drafts superseded by an explicit save or a delete."""
+    journal_ids = [str(journal_id) for journal_id in journal_ids]
+    if not journal_ids:
+        return
+
+    try:
+        redis_client = await get_redis_client()
+        async with redis_client.pipeline(transaction=True) as pipe:
+            pipe.zrem(PENDING_DRAFTS_KEY, *(pending_member(user_id, journal_id) for journal_id in journal_ids))
+            pipe.delete(*(draft_key(user_id, journal_id) for journal_id in journal_ids))
+            await pipe.execute()
+    except Exception as e:
+        logger.error(f"Failed to discard drafts for user {user_id}: {e}")
+
+
+async def flush_draft(db: AsyncSession, user_id: str, journal_id: str) -> bool:
+    """Persist a draft to journal_entries; returns False if nothing was written."""
+    redis_client = await get_redis_client()
+    member = pending_member(user_id, journal_id)
+
+    # Explicit saves discard the draft before updating the row, so reading it under
+    # the row lock never picks up a draft that an explicit save has superseded
+    result = await db.execute(
+        select(JournalEntry.id)
+        .where(JournalEntry.id == journal_id, JournalEntry.user_id == user_id)
+        .with_for_update()
+    )
+    locked = result.scalar() is not None
+
+    draft = await RedisHelper.redis_get(draft_key(user_id, journal_id)) if locked else None
+    if not draft:
+        await db.rollback()
+        await redis_client.zrem(PENDING_DRAFTS_KEY, member)
+        return False
+
+    new_hash = content_hash(draft["content"])
+    values = {"content": draft["content"], "content_hash": new_hash, "updated_at": datetime.now()}
+    # Autosaves may carry only content; keep the stored title then
+    if draft.get("title") is not None:
+        values["title"] = draft["title"]
+
+    previous = aliased(JournalEntry)
+    result = await db.execute(
+        update(JournalEntry)
+        .where(
+            JournalEntry.id == journal_id,
+            JournalEntry.user_id == user_id,
+            previous.id == JournalEntry.id
+        )
+        .values(**values)
+        .returning(
+            JournalEntry.title,
+            JournalEntry.entry_date,
+            previous.content_hash.is_distinct_from(new_hash).label("content_changed")
+        )
+        .execution_options(synchronize_session=False)
+    )
+    journal = result.first()
+
+    if journal and journal.content_changed:
+        publish_to_queue(db, "", "entry_queue", {
+            "id": str(journal_id),
+            "title": journal.title,
+            "content": draft["content"],
+            "entryDate": journal.entry_date.isoformat(),
+            "userId": user_id,
+        })
+
+    await db.commit()
+    if journal:
+        await response_cache.invalidate_user(user_id)
+
+    if journal and journal.content_changed:
+        notify_outbox()
+
+    # Leave the draft pending if another autosave landed while we were flushing
+    if await redis_client.zscore(PENDING_DRAFTS_KEY, member) == draft["savedAt"]:
+        async with redis_client.pipeline(transaction=True) as pipe:
+            pipe.zrem(PENDING_DRAFTS_KEY, member)
+            pipe.delete(draft_key(user_id, journal_id))
+            await pipe.execute()
+
+    return journal is not None
+
+
+async def flush_settled_drafts():
+    """Write-behind job: persist drafts that have not changed for DRAFT_SETTLE_SECONDS."""
+    try:
+        redis_client = await get_redis_client()
+        members = await redis_client.zrangebyscore(
+            PENDING_DRAFTS_KEY, "-inf", time.time() - DRAFT_SETTLE_SECONDS,
+            start=0, num=FLUSH_BATCH_SIZE
+        )
+        if not members:
+            return
+
+        async with AsyncSessionLocal() as db:
+            for member in members:
+                user_id, _, journal_id = member.partition(":")
+                if not journal_id:
+                    # Pre-scoping member without an owner; its draft can no longer be resolved
+                    await redis_client.zrem(PENDING_DRAFTS_KEY, member)
+                    logger.warning(f"Dropped unscoped pending draft {member}")
+                    continue
+                try:
+                    await flush_draft(db, user_id, journal_id)
+                except Exception as e:
+                    await db.rollback()
+                    logger.error(f"Failed to flush draft {journal_id}: {e}")
+
+        logger.info(f"Flushed {len(members)} settled draft(s).")
+    except Exception as e:
+        logger.error(f"Draft flush failed: {e}")
@@ -9,11 +9,12 @@ from sqlalchemy.dialects.postgresql import insert
 from app.db import engine
 from app.db.models import (
     JournalEntry, UserPreferences, SentimentScore,
-    Tag, Category, JournalEntryTag, JournalEntryCategory,
-    AnalyticsData
+    JournalEntryTag, JournalEntryCategory,
+    AnalyticsData, Tag, Category
 )
-from app.utils.functions import calculate_analytics, determine_time_of_day, determine_mood
-from app.services.openAI import analyze_sentiment_openai, entry_analysis
+from app.utils.functions import calculate_analytics, determine_time_of_day, determine_mood, content_hash
+from app.services.openAI import analyze_sentiment_openai, entry_analysis, ANALYSIS_VERSION
+from app.services import tag_resolver, response_cache, daily_stats, summary_cache
 from app.core.logger import logger
 import json
 from datetime import datetime
@@ -23,22 +24,64 @@ SessionLocal = async_sessionmaker(bind=engine, expire_on_commit=False)
 async def rabbitmq_handler(message: IncomingMessage):
     async with message.process():
         try:
-            msg_body = message.body
+            data = json.loads(message.body.decode())
+            # Imports used to enqueue one message per chunk; drain any still queued
+            entries = data["entries"] if "entries" in data else [data]
             async with SessionLocal() as session:
-                await journal_entry_worker(msg_body, session)
+                for entry in entries:
+                    await journal_entry_worker(entry, session)
         except Exception as e:
             logger.error(f"Error handling message: {e}")
 
-async def journal_entry_worker(msg_body: bytes, db: AsyncSession):
-    data = json.loads(msg_body.decode())
-
+async def find_cached_analysis(db: AsyncSession, user_id: str, analysis_hash: str):
+    result = await db.execute(
+        select(SentimentScore, AnalyticsData.analysis)
+        .join(AnalyticsData, AnalyticsData.journal_id == SentimentScore.journal_id)
+        .join(JournalEntry, JournalEntry.id == SentimentScore.journal_id)
+        .where(
+            JournalEntry.user_id == user_id,
+            AnalyticsData.content_hash == analysis_hash,
+            AnalyticsData.analysis_version == ANALYSIS_VERSION,
+            AnalyticsData.analysis.isnot(None),
+        )
+        .limit(1)
+    )
+    row = result.first()
+    if not row:
+        return None
+
+    sentiment, analysis = row
+    sentiment_analysis = {
+        "score": sentiment.score,
+        "comparative": sentiment.magnitude,
+        "calculation": sentiment.calculation,
+        "positive": [word for word in sentiment.positive_words.split(",") if word],
+        "negative": [word for word in sentiment.negative_words.split(",") if word],
+    }
+    return sentiment_analysis, analysis
+
+async def journal_entry_worker(data: dict, db: AsyncSession):
     content = data.get("content")
     journal_id = data.get("id")
     title = data.get("title")
     user_id = data.get("userId")
     entry_date = data.get("entryDate", datetime.now().isoformat())
 
+    analysis_hash = content_hash(content)
+
     try:
+        # Redelivery or replay of content that was already analyzed: one indexed lookup
+        analyzed_result = await db.execute(
+            select(AnalyticsData.id).where(
+                AnalyticsData.journal_id == journal_id,
+                AnalyticsData.content_hash == analysis_hash,
+                AnalyticsData.analysis_version == ANALYSIS_VERSION,
+            )
+        )
+        if analyzed_result.first():
+            logger.info(f"Journal entry {journal_id} already analyzed, skipping")
+            return
+
         # Ensure the database session is queried asynchronously
         user_pref_result = await db.execute(
             select(UserPreferences).where(UserPreferences.user_id == user_id)
@@ -49,24 +92,38 @@ async def journal_entry_worker(msg_body: bytes, db: AsyncSession):
         auto_tag = user_preferences.auto_tag if user_preferences else False
         summarize = user_preferences.summarize if user_preferences else False
 
-        sentiment_analysis = analyze_sentiment_openai(content)
+        # Identical text the user already wrote elsewhere reuses that analysis
+        cached = await find_cached_analysis(db, user_id, analysis_hash)
+        if cached:
+            sentiment_analysis, analysis = cached
+        else:
+            sentiment_analysis = analyze_sentiment_openai(content)
+            analysis = entry_analysis(content)
+
         mood = determine_mood(sentiment_analysis)
 
+        # Fallback results are stored but not marked as analyzed, so a redelivery retries them
+        failed = sentiment_analysis.get("failed") or analysis.get("failed")
+        stored_hash = None if failed else analysis_hash
+
         # Store sentiment score
-        sentiment_score = SentimentScore(
-            journal_id=journal_id,
-            score=sentiment_analysis["score"],
-            magnitude=sentiment_analysis["comparative"],
-            mood=mood,
-            calculation=sentiment_analysis["calculation"],
-            positive_words=",".join(sentiment_analysis["positive"]),
-            negative_words=",".join(sentiment_analysis["negative"]),
+        sentiment_values = {
+            "score": sentiment_analysis["score"],
+            "magnitude": sentiment_analysis["comparative"],
+            "mood": mood,
+            "calculation": sentiment_analysis["calculation"],
+            "positive_words": ",".join(sentiment_analysis["positive"]),
+            "negative_words": ",".join(sentiment_analysis["negative"]),
+            "content_hash": stored_hash,
+            "analysis_version": ANALYSIS_VERSION,
+        }
+        await db.execute(
+            insert(SentimentScore)
+            .values(journal_id=journal_id, **sentiment_values)
+            .on_conflict_do_update(index_elements=["journal_id"], set_=sentiment_values)
         )
-        db.add(sentiment_score)
-        await db.flush()
 
         # Journal entry analysis
-        analysis = entry_analysis(content)
         analysis_title = analysis.get("title")
         summary = analysis.get("summary")
         categories = analysis.get("categories", [])
@@ -90,33 +147,13 @@ async def journal_entry_worker(msg_body: bytes, db: AsyncSession):
 
         # Auto-tagging
         if auto_tag:
-            existing_tags = {tag.name for tag in existing_entry.tags}
-            new_tags = [tag.upper() for tag in tags if tag.upper() not in existing_tags]
-            for tag_name in new_tags:
-                tag_result = await db.execute(
-                    select(Tag).where(Tag.name == tag_name, Tag.user_id == user_id)
-                )
-                tag = tag_result.scalars().first()
-                if not tag:
-                    tag = Tag(name=tag_name, user_id=user_id)
-                    db.add(tag)
-                    await db.flush()  # Ensure to flush tag to DB asynchronously
-                db.add(JournalEntryTag(journal_entry_id=journal_id, tag_id=tag.id))
-        #
+            tag_ids = await tag_resolver.resolve_tags(db, tags, user_id)
+            await tag_resolver.link_entry(db, Tag, JournalEntryTag, "tag_id", journal_id, tag_ids, user_id)
+
         # Auto-categorizing
         if auto_categorize:
-            existing_cats = {cat.name for cat in existing_entry.categories}
-            new_cats = [cat.upper() for cat in categories if cat.upper() not in existing_cats]
-            for cat_name in new_cats:
-                cat_result = await db.execute(
-                    select(Category).where(Category.name == cat_name, Category.user_id == user_id)
-                )
-                category = cat_result.scalars().first()
-                if not category:
-                    category = Category(name=cat_name, user_id=user_id)
-                    db.add(category)
-                    await db.flush()  # Ensure to flush category to DB asynchronously
-                db.add(JournalEntryCategory(journal_entry_id=journal_id,  category_id=category.id))
+            category_ids = await tag_resolver.resolve_categories(db, categories, user_id)
+            await tag_resolver.link_entry(db, Category, JournalEntryCategory, "category_id", journal_id, category_ids, user_id)
 
         if update_fields:
             await db.execute(
@@ -141,6 +178,9 @@ async def journal_entry_worker(msg_body: bytes, db: AsyncSession):
             sentence_count= analytics_data["sentenceCount"],
             reading_time= analytics_data["readingTime"],
             average_sentence_length= analytics_data["averageSentenceLength"],
+            content_hash=stored_hash,
+            analysis_version=ANALYSIS_VERSION,
+            analysis=analysis,
         )
 
         update_dict = {
@@ -153,6 +193,10 @@ async def journal_entry_worker(msg_body: bytes, db: AsyncSession):
             "sentence_count": analytics_data["sentenceCount"],
             "reading_time": analytics_data["readingTime"],
             "average_sentence_length": analytics_data["averageSentenceLength"],
+            "content_hash": stored_hash,
+            "analysis_version": ANALYSIS_VERSION,
+            "analysis": analysis,
+            "updated_at": datetime.now(),
         }
 
         stmt = stmt.on_conflict_do_update(
@@ -162,8 +206,12 @@ async def journal_entry_worker(msg_body: bytes, db: AsyncSession):
 
         await db.execute(stmt)
 
+        # Re-derive the rollup days this entry lands in, in the same transaction
+        stat_days = await daily_stats.refresh_entry_days(db, user_id, journal_id)
 
         await db.commit()
+        await response_cache.invalidate_user(user_id)
+        await summary_cache.invalidate_months(user_id, stat_days)
 
     except Exception as e:
         await db.rollback()
@@ -13,6 +13,12 @@ from app.core.logger import logger
 
 client = OpenAI(api_key=settings.OPENAI_API_KEY)
 
+# Bump PROMPT_VERSION whenever the sentiment or entry-analysis prompts change,
+# so stored analyses are no longer treated as current
+ANALYSIS_MODEL = "gpt-4"
+PROMPT_VERSION = 1
+ANALYSIS_VERSION = f"{ANALYSIS_MODEL}:v{PROMPT_VERSION}"
+
 nlp_spacy = spacy.load("en_core_web_sm")
 
 
@@ -38,7 +44,7 @@ def analyze_sentiment_openai(text: str):
 Text: "{text}" """
 
         response = client.chat.completions.create(
-            model="gpt-4",
+            model=ANALYSIS_MODEL,
             messages=[
                 {"role": "system", "content": "You are an assistant that performs sentiment analysis."},
                 {"role": "user", "content": prompt}
@@ -59,7 +65,8 @@ Text: "{text}" """
                 "emotion": "Neutral",
                 "positive": [],
                 "negative": [],
-                "calculation": "Failed to parse OpenAI response"
+                "calculation": "Failed to parse OpenAI response",
+                "failed": True
             }
 
     except Exception as e:
@@ -71,7 +78,8 @@ Text: "{text}" """
             "emotion": "Neutral",
             "positive": [],
             "negative": [],
-            "calculation": "API call failed"
+            "calculation": "API call failed",
+            "failed": True
         }
 
 def entry_analysis(text: str):
@@ -87,7 +95,7 @@ def entry_analysis(text: str):
 
 Entry: {text}"""
 
-        response =  client.chat.completions.create(model="gpt-4",
+        response =  client.chat.completions.create(model=ANALYSIS_MODEL,
         messages=[
             {"role": "system", "content": "You are an assistant that generates journaling titles, summaries, categories, and tags."},
             {"role": "user", "content": prompt}
@@ -108,7 +116,8 @@ Entry: {text}"""
             "title": "Untitled",
             "summary": "No summary available.",
             "categories": ["Miscellaneous"],
-            "tags": []
+            "tags": [],
+            "failed": True
         }
 
 def generate_tags(text: str):
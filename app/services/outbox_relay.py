@@ -0,0 +1,105 @@
+import asyncio
+
+from typing import Tuple
+
+from sqlalchemy import delete, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+
+from app.core.logger import logger
+from app.db.models import OutboxMessage
+from app.db.session import AsyncSessionLocal
+from app.services.queueing import rabbitmq
+
+# Config
+BATCH_SIZE = 100
+POLL_INTERVAL_SECONDS = 2
+CONNECT_TIMEOUT_SECONDS = 5
+PUBLISH_TIMEOUT_SECONDS = 10
+MAX_ATTEMPTS = 10
+MAX_BACKOFF_SECONDS = 60
+
+outbox_ready = asyncio.Event()
+
+
+def notify_outbox():
+    """Wake the relay after a commit that staged outbox messages."""
+    outbox_ready.set()
+
+
+async def relay_outbox_batch(db: AsyncSession) -> Tuple[int, int]:
+    """Publish one batch of pending messages; returns (published, failed)."""
+    # Connect before taking row locks, so a broker outage never holds them
+    await asyncio.wait_for(rabbitmq.connect(), timeout=CONNECT_TIMEOUT_SECONDS)
+
+    result = await db.execute(
+        select(OutboxMessage)
+        .where(OutboxMessage.attempts < MAX_ATTEMPTS)
+        .order_by(OutboxMessage.created_at)
+        .limit(BATCH_SIZE)
+        .with_for_update(skip_locked=True)
+    )
+    messages = result.scalars().all()
+
+    if not messages:
+        return 0, 0
+
+    # Confirms are awaited concurrently, so a batch costs about one broker round trip
+    outcomes = await asyncio.gather(
+        *(
+            asyncio.wait_for(rabbitmq.publish(message.queue_name, message.payload), timeout=PUBLISH_TIMEOUT_SECONDS)
+            for message in messages
+        ),
+        return_exceptions=True,
+    )
+
+    published_ids = [m.id for m, outcome in zip(messages, outcomes) if not isinstance(outcome, Exception)]
+    failed = [m for m, outcome in zip(messages, outcomes) if isinstance(outcome, Exception)]
+    failed_ids = [m.id for m in failed]
+
+    if published_ids:
+        await db.execute(
+            delete(OutboxMessage).where(OutboxMessage.id.in_(published_ids))
+        )
+    if failed_ids:
+        logger.error(f"[OUTBOX] Failed to publish {len(failed_ids)} message(s), will retry")
+        dead_ids = [m.id for m in failed if m.attempts + 1 >= MAX_ATTEMPTS]
+        if dead_ids:
+            logger.error(f"[OUTBOX] Giving up on {len(dead_ids)} message(s) after {MAX_ATTEMPTS} attempts: {dead_ids}")
+        await db.execute(
+            update(OutboxMessage)
+            .where(OutboxMessage.id.in_(failed_ids))
+            .values(attempts=OutboxMessage.attempts + 1)
+        )
+
+    await db.commit()
+    return len(published_ids), len(failed_ids)
+
+
+async def run_outbox_relay():
+    logger.info("[OUTBOX] Relay started")
+    failed_rounds = 0
+    while True:
+        outbox_ready.clear()
+        published, failed = 0, 0
+        try:
+            async with AsyncSessionLocal() as db:
+                published, failed = await relay_outbox_batch(db)
+        except Exception as e:
+            failed = 1
+            logger.error(f"[OUTBOX] Relay error: {e!r}")
+
+        # Back off exponentially while the broker keeps failing
+        if failed:
+            failed_rounds += 1
+            await asyncio.sleep(min(POLL_INTERVAL_SECONDS * 2 ** failed_rounds, MAX_BACKOFF_SECONDS))
+            continue
+        failed_rounds = 0
+
+        if published >= BATCH_SIZE:
+            continue
+
+        try:
+            await asyncio.wait_for(outbox_ready.wait(), timeout=POLL_INTERVAL_SECONDS)
+        except asyncio.TimeoutError:
+            pass
@@ -1,7 +1,23 @@
-import asyncio
+from typing import Iterable
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
 from app.core.rabbitmq import RabbitMQ
+from app.db.models import OutboxMessage
 
 rabbitmq = RabbitMQ("amqp://localhost")
 
-def publish_to_queue(exchange: str, queue_name: str, message_body: dict):
-    asyncio.create_task(rabbitmq.publish(queue_name, message_body))
+def publish_to_queue(db: AsyncSession, exchange: str, queue_name: str, message_body: dict):
+    """Stage a message in the outbox; it is published by the relay once the caller commits."""
+    db.add(OutboxMessage(exchange=exchange, queue_name=queue_name, payload=message_body))
+
+
+async def publish_many_to_queue(db: AsyncSession, exchange: str, queue_name: str, message_bodies: Iterable[dict]):
+    """Stage one outbox message per body with a single multi-row insert."""
+    rows = [
+        {"exchange": exchange, "queue_name": queue_name, "payload": body}
+        for body in message_bodies
+    ]
+    if rows:
+        await db.execute(insert(OutboxMessage), rows)
@@ -0,0 +1,53 @@
+import hashlib
+import json
+
+import orjson
+
+from typing import Any, Optional, Tuple
+
+from app.configs.redis_config import get_redis_client
+from app.core.logger import logger
+from app.core.redis_helper import RedisHelper
+
+# Config
+CACHE_VERSION_KEY_PREFIX = "cache-version"
+RESPONSE_CACHE_KEY_PREFIX = "response-cache"
+RESPONSE_CACHE_TTL_SECONDS = 300
+
+
+def version_key(user_id: str) -> str:
+    return RedisHelper._make_key(CACHE_VERSION_KEY_PREFIX, str(user_id))
+
+
+async def lookup(user_id: str, name: str, *params) -> Tuple[Optional[str], Optional[Any]]:
+    """Return (cache_key, cached_payload) for the user's current cache generation."""
+    try:
+        redis_client = await get_redis_client()
+        version = await redis_client.get(version_key(user_id)) or "0"
+        digest = hashlib.sha256(json.dumps([str(param) for param in params]).encode()).hexdigest()[:16]
+        key = f"{RESPONSE_CACHE_KEY_PREFIX}-{user_id}-{version}-{name}-{digest}"
+
+        cached = await redis_client.get(key)
+        return key, orjson.loads(cached) if cached else None
+    except Exception as e:
+        logger.error(f"Response cache lookup failed for {name}: {e}")
+        return None, None
+
+
+async def store(key: Optional[str], payload: Any):
+    if key is None:
+        return
+    try:
+        redis_client = await get_redis_client()
+        await redis_client.set(key, orjson.dumps(payload), ex=RESPONSE_CACHE_TTL_SECONDS)
+    except Exception as e:
+        logger.error(f"Response cache store failed for {key}: {e}")
+
+
+async def invalidate_user(user_id):
+    """Start a new cache generation for the user; entries from older ones just expire."""
+    try:
+        redis_client = await get_redis_client()
+        await redis_client.incr(version_key(user_id))
+    except Exception as e:
+        logger.error(f"Response cache invalidation failed for user {user_id}: {e}")
@@ -1,7 +1,9 @@
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
+from apscheduler.triggers.interval import IntervalTrigger
 
 from app.services.password_service import deactivate_expired_passwords
+from app.services.drafts import flush_settled_drafts
 from app.core.logger import logger
 
 def start_cron_jobs():
@@ -14,5 +16,15 @@ def start_cron_jobs():
         replace_existing=True
     )
 
+    scheduler.add_job(
+        flush_settled_drafts,
+        IntervalTrigger(seconds=15),
+        id="flush_settled_drafts",
+        replace_existing=True,
+        max_instances=1,
+        coalesce=True
+    )
+
     scheduler.start()
     logger.info("Password expiry cron job scheduled.")
+    logger.info("Draft write-behind job scheduled.")
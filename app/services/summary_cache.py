@@ -0,0 +1,86 @@
+import orjson
+
+from datetime import date
+from typing import Dict, Iterable, List, Tuple
+
+from app.configs.redis_config import get_redis_client
+from app.core.logger import logger
+from app.core.redis_helper import RedisHelper
+
+# Config
+SUMMARY_VERSION_KEY_PREFIX = "summary-version"
+SUMMARY_BUCKET_KEY_PREFIX = "summary-bucket"
+SUMMARY_BUCKET_TTL_SECONDS = 7 * 24 * 60 * 60
+
+
+def month_of(day: date) -> date:
+    return date(day.year, day.month, 1)
+
+
+def user_version_key(user_id: str) -> str:
+    return RedisHelper._make_key(SUMMARY_VERSION_KEY_PREFIX, str(user_id))
+
+
+def month_version_key(user_id: str, month: date) -> str:
+    return RedisHelper._make_key(SUMMARY_VERSION_KEY_PREFIX, f"{user_id}-{month:%Y-%m}")
+
+
+async def load_months(user_id: str, months: List[date]) -> Tuple[Dict[date, str], Dict[date, dict]]:
+    """Return ({month: cache_key}, {month: cached_bucket}) for the user's month buckets."""
+    if not months:
+        return {}, {}
+    try:
+        redis_client = await get_redis_client()
+        versions = await redis_client.mget(
+            user_version_key(user_id), *(month_version_key(user_id, month) for month in months)
+        )
+        user_version = versions[0] or "0"
+        keys = {
+            month: f"{SUMMARY_BUCKET_KEY_PREFIX}-{user_id}-{user_version}-{month:%Y-%m}-{month_version or '0'}"
+            for month, month_version in zip(months, versions[1:])
+        }
+
+        cached = await redis_client.mget(*keys.values())
+        buckets = {month: orjson.loads(value) for month, value in zip(keys, cached) if value}
+        return keys, buckets
+    except Exception as e:
+        logger.error(f"Summary cache lookup failed for user {user_id}: {e}")
+        return {}, {}
+
+
+async def store_months(keys: Dict[date, str], buckets: Dict[date, dict]):
+    buckets = {month: bucket for month, bucket in buckets.items() if month in keys}
+    if not buckets:
+        return
+    try:
+        redis_client = await get_redis_client()
+        async with redis_client.pipeline(transaction=False) as pipe:
+            for month, bucket in buckets.items():
+                pipe.set(keys[month], orjson.dumps(bucket), ex=SUMMARY_BUCKET_TTL_SECONDS)
+            await pipe.execute()
+    except Exception as e:
+        logger.error(f"Summary cache store failed: {e}")
+
+
+async def invalidate_months(user_id, days: Iterable[date]):
+    """Drop the user's cached buckets for the months containing these days."""
+    months = {month_of(day) for day in days}
+    if not months:
+        return
+    try:
+        redis_client = await get_redis_client()
+        async with redis_client.pipeline(transaction=False) as pipe:
+            for month in months:
+                pipe.incr(month_version_key(user_id, month))
+            await pipe.execute()
+    except Exception as e:
+        logger.error(f"Summary cache invalidation failed for user {user_id}: {e}")
+
+
+async def invalidate_user(user_id):
+    """Drop every cached bucket of the user, for writes that are not tied to a month."""
+    try:
+        redis_client = await get_redis_client()
+        await redis_client.incr(user_version_key(user_id))
+    except Exception as e:
+        logger.error(f"Summary cache invalidation failed for user {user_id}: {e}")
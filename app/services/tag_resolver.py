@@ -0,0 +1,222 @@
+import time
+
+from collections import OrderedDict
+from typing import Dict, Iterable, Optional, Tuple
+from uuid import UUID, uuid4
+
+from sqlalchemy import delete, literal, tuple_
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+
+from app.db.models import Category, Tag
+
+# Config
+CACHE_MAX_ENTRIES = 10000
+CACHE_TTL_SECONDS = 300
+
+CONSTRAINTS = {
+    Tag: "uq_tag_name_user_id",
+    Category: "uix_name_user_id",
+}
+
+
+def normalize_name(name: str) -> str:
+    return name.strip().upper()
+
+
+class NameCache:
+    """Bounded LRU of (table, user_id, name) -> id with a reverse index for eviction by id."""
+
+    def __init__(self, max_entries: int = CACHE_MAX_ENTRIES, ttl: int = CACHE_TTL_SECONDS):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: "OrderedDict[Tuple[str, str, str], Tuple[UUID, float]]" = OrderedDict()
+        self._keys_by_id: Dict[UUID, Tuple[str, str, str]] = {}
+
+    def get(self, key: Tuple[str, str, str]) -> Optional[UUID]:
+        cached = self._entries.get(key)
+        if cached is None:
+            return None
+
+        id_, stored_at = cached
+        if time.monotonic() - stored_at > self.ttl:
+            self._remove(key)
+            return None
+
+        self._entries.move_to_end(key)
+        return id_
+
+    def put(self, key: Tuple[str, str, str], id_: UUID):
+        if key in self._entries:
+            self._remove(key)
+
+        self._entries[key] = (id_, time.monotonic())
+        self._keys_by_id[id_] = key
+
+        while len(self._entries) > self.max_entries:
+            oldest, _ = next(iter(self._entries.items()))
+            self._remove(oldest)
+
+    def evict_id(self, id_: UUID):
+        key = self._keys_by_id.get(id_)
+        if key is not None:
+            self._remove(key)
+
+    def clear(self):
+        self._entries.clear()
+        self._keys_by_id.clear()
+
+    def _remove(self, key: Tuple[str, str, str]):
+        id_, _ = self._entries.pop(key)
+        self._keys_by_id.pop(id_, None)
+
+
+name_cache = NameCache()
+
+
+async def resolve_names(
+        db: AsyncSession,
+        model,
+        names: Iterable[str],
+        user_id: str,
+        use_cache: bool = True
+) -> Dict[str, UUID]:
+    """Map normalized tag/category names to ids, creating the missing ones."""
+    normalized = list(dict.fromkeys(normalize_name(name) for name in names if name and name.strip()))
+    if not normalized:
+        return {}
+
+    table = model.__tablename__
+    user_key = str(user_id)
+
+    resolved: Dict[str, UUID] = {}
+    misses = []
+    for name in normalized:
+        cached = name_cache.get((table, user_key, name)) if use_cache else None
+        if cached is not None:
+            resolved[name] = cached
+        else:
+            misses.append(name)
+
+    if misses:
+        inserted = (
+            insert(model)
+            .values([{"id": uuid4(), "name": name, "user_id": user_id} for name in misses])
+            .on_conflict_do_nothing(constraint=CONSTRAINTS[model])
+            .returning(model.id, model.name)
+            .cte("inserted")
+        )
+        result = await db.execute(
+            select(inserted.c.name, inserted.c.id, literal(True).label("created")).union_all(
+                select(model.name, model.id, literal(False)).filter(
+                    model.user_id == user_id,
+                    model.name.in_(misses)
+                )
+            )
+        )
+        for name, id_, created in result.all():
+            resolved[name] = id_
+            if not created:
+                name_cache.put((table, user_key, name), id_)
+
+        missing = [name for name in misses if name not in resolved]
+        if missing:
+            result = await db.execute(
+                select(model.name, model.id).filter(
+                    model.user_id == user_id,
+                    model.name.in_(missing)
+                )
+            )
+            resolved.update({name: id_ for name, id_ in result.all()})
+
+    return {name: resolved[name] for name in normalized if name in resolved}
+
+
+async def resolve_tags(db: AsyncSession, names: Iterable[str], user_id: str, use_cache: bool = True) -> Dict[str, UUID]:
+    return await resolve_names(db, Tag, names, user_id, use_cache)
+
+
+async def resolve_categories(db: AsyncSession, names: Iterable[str], user_id: str, use_cache: bool = True) -> Dict[str, UUID]:
+    return await resolve_names(db, Category, names, user_id, use_cache)
+
+
+def invalidate(id_):
+    """Drop a tag/category from the cache after it is renamed or deleted."""
+    name_cache.evict_id(UUID(str(id_)))
+
+
+async def link_entry(
+        db: AsyncSession,
+        model,
+        association,
+        column: str,
+        journal_id,
+        resolved: Dict[str, UUID],
+        user_id: str
+) -> Dict[str, UUID]:
+    """Link resolved names to an entry; returns the name -> id map actually linked."""
+    if not resolved:
+        return {}
+
+    valid = (
+        select(model.id)
+        .where(model.user_id == user_id, tuple_(model.name, model.id).in_(list(resolved.items())))
+        .cte("valid")
+    )
+    linked = (
+        insert(association)
+        .from_select(
+            ["journal_entry_id", column],
+            select(literal(journal_id, association.journal_entry_id.type), valid.c.id)
+        )
+        .on_conflict_do_nothing()
+        .cte("linked")
+    )
+    result = await db.execute(select(valid.c.id).add_cte(linked))
+    valid_ids = set(result.scalars().all())
+
+    stale = [name for name, id_ in resolved.items() if id_ not in valid_ids]
+    if not stale:
+        return resolved
+
+    for name in stale:
+        invalidate(resolved[name])
+    fresh = await resolve_names(db, model, stale, user_id, use_cache=False)
+    if fresh:
+        await db.execute(
+            insert(association)
+            .values([{"journal_entry_id": journal_id, column: id_} for id_ in fresh.values()])
+            .on_conflict_do_nothing()
+        )
+    return {**{name: id_ for name, id_ in resolved.items() if id_ in valid_ids}, **fresh}
+
+
+async def sync_entry_links(
+        db: AsyncSession,
+        model,
+        association,
+        column: str,
+        journal_id,
+        resolved: Dict[str, UUID],
+        user_id: str
+) -> Dict[str, UUID]:
+    """Make an entry's associations match the resolved names, touching only the rows that differ."""
+    ids = list(resolved.values())
+    stmt = delete(association).where(association.journal_entry_id == journal_id)
+    if ids:
+        stmt = stmt.where(getattr(association, column).not_in(ids))
+
+    await db.execute(stmt)
+    linked = await link_entry(db, model, association, column, journal_id, resolved, user_id)
+
+    # A stale cached id kept its existing link above; drop it now that it is replaced
+    replaced = set(ids) - set(linked.values())
+    if replaced:
+        await db.execute(
+            delete(association).where(
+                association.journal_entry_id == journal_id,
+                getattr(association, column).in_(replaced)
+            )
+        )
+    return linked
@@ -1,6 +1,11 @@
+import base64
+import hashlib
+import json
+import re
+
 from datetime import datetime, timedelta
 
-from typing import List, Dict
+from typing import List, Dict, Optional
 
 from app.db import Mood, TimeOfDay
 
@@ -48,6 +53,44 @@ def calculate_analytics(content: str) -> dict:
     }
 
 
+def content_hash(content: str) -> str:
+    # Whitespace-only edits should not count as a content change
+    normalized = re.sub(r"\s+", " ", content or "").strip()
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
+def encode_cursor(values: list) -> str:
+    raw = json.dumps([str(value) for value in values], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> list:
+    """Inverse of encode_cursor; raises ValueError on a malformed token."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(raw)
+    except Exception as e:
+        raise ValueError("Invalid cursor") from e
+    if not isinstance(values, list):
+        raise ValueError("Invalid cursor")
+    return values
+
+
+def make_etag(*parts) -> str:
+    """Strong ETag over the given version values."""
+    raw = json.dumps([str(part) for part in parts], separators=(",", ":"))
+    return f'"{hashlib.sha256(raw.encode()).hexdigest()[:32]}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: Optional[str]) -> bool:
+    if not if_none_match or not etag:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = [candidate.strip() for candidate in if_none_match.split(",")]
+    return any(candidate.removeprefix("W/") == etag for candidate in candidates)
+
+
 def get_week(date: datetime) -> tuple:
     year, week_num, _ = date.isocalendar()
 